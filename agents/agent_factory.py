@@ -1,14 +1,70 @@
 # Agent factory module - Improved Version
 
-from typing import Dict, Any, Optional
-from langchain_google_genai import ChatGoogleGenerativeAI as ChatLLM
-from langchain.memory import ConversationBufferMemory
+from typing import Dict, Any, Iterator, List, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from .chat_agent import GraphChatAgent
+from .memory import (
+    BoundedBufferMemory,
+    SummarizingChatMessageHistory,
+    TokenBoundedChatMessageHistory,
+)
+from .prompts import get_prompts
+import functools
 import os
 import logging
+import threading
+import time
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI as ChatLLM
 
 logger = logging.getLogger(__name__)
 
+# Config keys owned by the factory that must not be passed through to agents
+_INFRASTRUCTURE_KEYS = frozenset(("llm", "memory"))
+
+# Config keys expected to be set explicitly (defaults are used otherwise)
+_REQUIRED_KEYS = frozenset({"model_name", "temperature", "max_tokens"})
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_api_key() -> Optional[str]:
+    """Resolve the LLM API key from the environment (cached after first read)"""
+    return os.getenv("LLM_API_KEY") or os.getenv("GOOGLE_API_KEY")
+
+
+@dataclass(slots=True, frozen=True)
+class FactoryConfig:
+    """Typed view of the factory configuration, resolved once at init"""
+
+    model_name: str = "default-model"
+    temperature: float = 0.0
+    max_tokens: int = 2000
+    memory_type: str = "summary"
+    memory_token_limit: int = 2000
+    memory_max_messages: int = 8
+    memory_summarize_batch: int = 4
+    verbose: bool = False
+    max_graph_iterations: int = 3
+    supervisor_confidence_threshold: float = 0.7
+    max_rewrite_attempts: int = 2
+    pool_min_size: int = 1
+    # Concurrent sessions with their own agent and memory; beyond this, a new
+    # session waits up to pool_acquire_timeout for an agent to be released or
+    # for another session to go idle for pool_idle_timeout (its memory is then
+    # reset), and gets a busy error otherwise
+    pool_max_size: int = 8
+    pool_idle_timeout: float = 300.0
+    pool_acquire_timeout: float = 30.0
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "FactoryConfig":
+        """Build from a raw config dict, ignoring unknown keys"""
+        return cls(
+            **{k: config[k] for k in cls.__dataclass_fields__ if k in config}
+        )
+
 
 class AgentFactory:
     """
@@ -16,6 +72,15 @@ class AgentFactory:
     Handles all infrastructure setup (LLM, memory, etc.)
     """
 
+    __slots__ = (
+        "config",
+        "cfg",
+        "_agent_config_base",
+        "llm",
+        "_initialized",
+        "_llm_info",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the agent factory
@@ -24,8 +89,13 @@ class AgentFactory:
             config (Dict[str, Any]): Factory configuration
         """
         self.config = config
+        self.cfg = FactoryConfig.from_dict(config)
+        self._agent_config_base = {
+            k: v for k, v in config.items() if k not in _INFRASTRUCTURE_KEYS
+        }
         self.llm = None
         self._initialized = False
+        self._llm_info: Optional[Dict[str, Any]] = None
 
         # Initialize infrastructure components
         self._initialize_infrastructure()
@@ -43,10 +113,10 @@ class AgentFactory:
             logger.info("AgentFactory infrastructure initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize AgentFactory: {e}")
+            logger.error("Failed to initialize AgentFactory: %s", e)
             raise
 
-    def _create_llm(self) -> ChatLLM:
+    def _create_llm(self) -> "ChatLLM":
         """
         Initialize the LLM with configuration
 
@@ -54,7 +124,7 @@ class AgentFactory:
             ChatLLM: Configured LLM instance
         """
         # Get API key from environment
-        api_key = os.getenv("LLM_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        api_key = _resolve_api_key()
         if not api_key:
             raise ValueError(
                 "LLM_API_KEY environment variable is required. "
@@ -63,30 +133,34 @@ class AgentFactory:
 
         # Create LLM with configuration
         llm_config = {
-            "model": self.config.get("model_name", "default-model"),
-            "temperature": self.config.get("temperature", 0.0),
-            "max_tokens": self.config.get("max_tokens", 2000),
+            "model": self.cfg.model_name,
+            "temperature": self.cfg.temperature,
+            "max_tokens": self.cfg.max_tokens,
             "google_api_key": api_key,  # Keep original param name for compatibility
         }
 
         try:
+            # Imported lazily: the provider SDK is expensive to import
+            from langchain_google_genai import ChatGoogleGenerativeAI as ChatLLM
+
             llm = ChatLLM(**llm_config)
-            logger.info(f"LLM initialized with model: {llm_config['model']}")
+            logger.info("LLM initialized with model: %s", llm_config["model"])
             return llm
 
         except Exception as e:
-            logger.error(f"Failed to initialize LLM: {e}")
+            logger.error("Failed to initialize LLM: %s", e)
             raise ValueError(f"LLM initialization failed: {e}")
 
     def _validate_config(self) -> None:
         """Validate factory configuration"""
-        required_keys = ["model_name", "temperature", "max_tokens"]
-        missing_keys = [key for key in required_keys if key not in self.config]
+        missing_keys = _REQUIRED_KEYS.difference(self.config)
 
         if missing_keys:
-            logger.warning(f"Missing config keys (using defaults): {missing_keys}")
+            logger.warning(
+                "Missing config keys (using defaults): %s", sorted(missing_keys)
+            )
 
-    def _create_memory(self, memory_type: str = "buffer") -> ConversationBufferMemory:
+    def _create_memory(self, memory_type: str = "buffer") -> BoundedBufferMemory:
         """
         Create conversation memory instance
 
@@ -94,19 +168,34 @@ class AgentFactory:
             memory_type (str): Type of memory to create
 
         Returns:
-            ConversationBufferMemory: Configured memory instance
+            BoundedBufferMemory: Configured memory instance
         """
         if memory_type == "buffer":
-            return ConversationBufferMemory(
-                memory_key="chat_history",
-                return_messages=True,
-                max_token_limit=self.config.get("memory_token_limit", 2000),
-                human_prefix="Human",
-                ai_prefix="Assistant",
+            # ConversationBufferMemory ignores max_token_limit, so use a
+            # history that actually evicts old messages past the budget
+            chat_memory = TokenBoundedChatMessageHistory(
+                llm=self.llm,
+                max_token_limit=self.cfg.memory_token_limit,
+            )
+        elif memory_type == "summary":
+            # Keep recent turns verbatim and fold older ones into a summary
+            chat_memory = SummarizingChatMessageHistory(
+                llm=self.llm,
+                max_messages=self.cfg.memory_max_messages,
+                summarize_batch=self.cfg.memory_summarize_batch,
+                summary_prompt=get_prompts()["memory_summary"],
             )
         else:
             raise ValueError(f"Unsupported memory type: {memory_type}")
 
+        return BoundedBufferMemory(
+            chat_memory=chat_memory,
+            memory_key="chat_history",
+            return_messages=True,
+            human_prefix="Human",
+            ai_prefix="Assistant",
+        )
+
     def create_chat_agent(self) -> "GraphChatAgent":
         """
         Create a graph-based chat agent with pre-configured infrastructure
@@ -119,7 +208,7 @@ class AgentFactory:
 
         try:
             # Create memory for this agent instance
-            memory = self._create_memory("buffer")
+            memory = self._create_memory(self.cfg.memory_type)
 
             # Prepare agent configuration with infrastructure components
             agent_config = {
@@ -128,15 +217,13 @@ class AgentFactory:
                 "memory": memory,
                 # Agent-specific configuration
                 "agent_type": "chat",
-                "verbose": self.config.get("verbose", False),
-                "max_iterations": self.config.get("max_graph_iterations", 3),
+                "verbose": self.cfg.verbose,
+                "max_iterations": self.cfg.max_graph_iterations,
                 # Graph-specific configuration
-                "supervisor_confidence_threshold": self.config.get(
-                    "supervisor_confidence_threshold", 0.7
-                ),
-                "max_rewrite_attempts": self.config.get("max_rewrite_attempts", 2),
+                "supervisor_confidence_threshold": self.cfg.supervisor_confidence_threshold,
+                "max_rewrite_attempts": self.cfg.max_rewrite_attempts,
                 # Pass through other config
-                **{k: v for k, v in self.config.items() if k not in ["llm", "memory"]},
+                **self._agent_config_base,
             }
 
             # Create and initialize the agent
@@ -147,7 +234,7 @@ class AgentFactory:
             return chat_agent
 
         except Exception as e:
-            logger.error(f"Failed to create GraphChatAgent: {e}")
+            logger.error("Failed to create GraphChatAgent: %s", e)
             raise
 
 
@@ -156,17 +243,229 @@ class AgentFactory:
         if not self._initialized:
             return {"status": "not_initialized"}
 
-        return {
-            "status": "initialized",
-            "model": self.config.get("model_name", "unknown"),
-            "temperature": self.config.get("temperature", 0.0),
-            "max_tokens": self.config.get("max_tokens", 2000),
-        }
+        # Static once initialized, so build it a single time
+        if self._llm_info is None:
+            self._llm_info = {
+                "status": "initialized",
+                "model": self.cfg.model_name,
+                "temperature": self.cfg.temperature,
+                "max_tokens": self.cfg.max_tokens,
+            }
+        return self._llm_info
+
+
+@dataclass
+class AgentPoolEntry:
+    """A pooled GraphChatAgent together with its bookkeeping"""
+
+    agent: GraphChatAgent
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def idle_time(self) -> float:
+        """Seconds since the entry was last released back to the pool"""
+        return time.monotonic() - self.last_used
+
+
+class AgentPool:
+    """
+    Bounded pool of pre-warmed GraphChatAgent instances
+    Each agent owns its conversation memory but shares the compiled graph,
+    so concurrent sessions neither cross-talk nor re-pay agent setup
+
+    The pool only uses thread primitives and prunes idle agents on checkout
+    and release, so it is not bound to any event loop
+    """
+
+    # Bucket holding agents that are not bound to any session yet
+    WARM_KEY = "__warm__"
+
+    def __init__(
+        self,
+        factory: AgentFactory,
+        min_size: int = 1,
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        acquire_timeout: float = 30.0,
+    ):
+        """
+        Initialize the agent pool
+
+        Args:
+            factory (AgentFactory): Factory used to build new agents
+            min_size (int): Number of agents kept warm at all times
+            max_size (int): Upper bound on live agents
+            idle_timeout (float): Seconds after which an idle agent is pruned
+                (or handed to another session when the pool is full)
+            acquire_timeout (float): Seconds to wait for an agent when the
+                pool is full before raising TimeoutError
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool bounds: min_size={min_size}, max_size={max_size}"
+            )
+
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: Dict[str, List[AgentPoolEntry]] = {}
+        self._size = 0
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of live agents (idle and in use)"""
+        return self._size
+
+    def start(self) -> None:
+        """Pre-warm min_size agents"""
+        with self._cond:
+            while self._size < self.min_size:
+                agent = self.factory.create_chat_agent()
+                self._size += 1
+                self._idle.setdefault(self.WARM_KEY, []).append(
+                    AgentPoolEntry(agent)
+                )
+        logger.info("AgentPool started with %s warm agents", self._size)
+
+    def close(self) -> None:
+        """Drop all idle agents"""
+        with self._cond:
+            self._size -= sum(len(entries) for entries in self._idle.values())
+            self._idle.clear()
+            self._cond.notify_all()
+
+    @contextmanager
+    def acquire(self, key: str = WARM_KEY) -> Iterator[GraphChatAgent]:
+        """
+        Check an agent out of the pool for the duration of the context
+        Blocks while the pool is full and no agent is free; async callers
+        should enter it through asyncio.to_thread
+
+        Raises:
+            TimeoutError: No agent became free within acquire_timeout
+
+        Args:
+            key (str): Session key; the same key gets back the same agent
+                (and its conversation memory) while it stays pooled
+
+        Yields:
+            GraphChatAgent: Agent reserved for the caller
+        """
+        entry = self._checkout(key)
+        try:
+            yield entry.agent
+        finally:
+            self.release(entry, key)
+
+    def release(self, entry: AgentPoolEntry, key: str = WARM_KEY) -> None:
+        """Return an agent to the pool under the given session key"""
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._idle.setdefault(key, []).append(entry)
+            self._prune_idle()
+            self._cond.notify()
+
+    def _checkout(self, key: str) -> AgentPoolEntry:
+        """Reserve an idle agent, create one, or wait for one to become free"""
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._cond:
+            self._prune_idle()
+            while True:
+                for bucket in (key, self.WARM_KEY):
+                    entries = self._idle.get(bucket)
+                    if entries:
+                        return entries.pop()
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                # Pool is full: only a session idle past idle_timeout (which
+                # would be pruned anyway) gives up its agent and memory
+                expired = self._pop_expired()
+                if expired is not None:
+                    logger.info(
+                        "Reassigning an agent idle for %.0fs to a new session",
+                        expired.idle_time,
+                    )
+                    expired.agent.memory.clear()
+                    return expired
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"All {self.max_size} agents are busy; try again shortly"
+                    )
+                self._cond.wait(min(remaining, self._next_expiry()))
+
+        try:
+            agent = self.factory.create_chat_agent()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        return AgentPoolEntry(agent)
+
+    def _pop_expired(self) -> Optional[AgentPoolEntry]:
+        """Remove and return the oldest entry idle for longer than idle_timeout"""
+        oldest: Optional[AgentPoolEntry] = None
+        oldest_key = None
+        for bucket, entries in self._idle.items():
+            if entries and entries[0].idle_time > self.idle_timeout and (
+                oldest is None or entries[0].last_used < oldest.last_used
+            ):
+                oldest, oldest_key = entries[0], bucket
+
+        if oldest_key is None:
+            return None
+        entries = self._idle[oldest_key]
+        entries.pop(0)
+        if not entries:
+            del self._idle[oldest_key]
+        return oldest
+
+    def _next_expiry(self) -> float:
+        """Seconds until the next idle entry passes idle_timeout"""
+        idle_times = [
+            entry.idle_time for entries in self._idle.values() for entry in entries
+        ]
+        if not idle_times:
+            return self.acquire_timeout
+        return max(self.idle_timeout - max(idle_times), 0.01)
+
+    def _prune_idle(self) -> None:
+        """Drop agents idle for longer than idle_timeout (caller holds the lock)"""
+        for bucket in list(self._idle):
+            kept = []
+            for entry in self._idle[bucket]:
+                if entry.idle_time > self.idle_timeout and self._size > self.min_size:
+                    self._size -= 1
+                else:
+                    kept.append(entry)
+
+            if kept:
+                self._idle[bucket] = kept
+            else:
+                del self._idle[bucket]
 
 
 # Global agent management (singleton pattern for efficiency)
 _agent_factory: Optional[AgentFactory] = None
 _chat_agent: Optional[GraphChatAgent] = None
+_agent_pool: Optional[AgentPool] = None
+_agent_lock = threading.Lock()
+_status_cache: Optional[Dict[str, Any]] = None
+
+
+def _invalidate_status_cache() -> None:
+    """Drop the cached factory status after the global agents change"""
+    global _status_cache
+    _status_cache = None
 
 
 def initialize_factory(config: Dict[str, Any]) -> AgentFactory:
@@ -183,11 +482,12 @@ def initialize_factory(config: Dict[str, Any]) -> AgentFactory:
 
     try:
         _agent_factory = AgentFactory(config)
+        _invalidate_status_cache()
         logger.info("Global AgentFactory initialized")
         return _agent_factory
 
     except Exception as e:
-        logger.error(f"Failed to initialize global AgentFactory: {e}")
+        logger.error("Failed to initialize global AgentFactory: %s", e)
         raise
 
 
@@ -203,18 +503,67 @@ def get_chat_agent(config: Dict[str, Any]) -> "GraphChatAgent":
     """
     global _agent_factory, _chat_agent
 
-    # Initialize factory if needed
-    if _agent_factory is None:
-        _agent_factory = initialize_factory(config)
+    # Fast path: agent already built, no locking needed
+    agent = _chat_agent
+    if agent is not None:
+        return agent
+
+    with _agent_lock:
+        # Re-check under the lock in case another thread built it meanwhile
+        if _chat_agent is not None:
+            return _chat_agent
+
+        # Initialize factory if needed
+        if _agent_factory is None:
+            _agent_factory = initialize_factory(config)
 
-    # Create chat agent if needed
-    if _chat_agent is None:
         _chat_agent = _agent_factory.create_chat_agent()
+        _invalidate_status_cache()
         logger.info("Global GraphChatAgent instance created")
 
-    return _chat_agent
+        return _chat_agent
+
+
+def get_agent_pool(config: Dict[str, Any]) -> AgentPool:
+    """
+    Get or create the global (pre-warmed) agent pool
+    Use ``with get_agent_pool(config).acquire(session_id) as agent`` to give
+    each session its own agent and conversation memory
+
+    Args:
+        config (Dict[str, Any]): Agent configuration, including optional
+            pool_min_size, pool_max_size and pool_idle_timeout
+
+    Returns:
+        AgentPool: Shared agent pool
+    """
+    global _agent_factory, _agent_pool
+
+    pool = _agent_pool
+    if pool is not None:
+        return pool
 
+    with _agent_lock:
+        if _agent_pool is not None:
+            return _agent_pool
 
+        if _agent_factory is None:
+            _agent_factory = initialize_factory(config)
+
+        cfg = _agent_factory.cfg
+        pool = AgentPool(
+            _agent_factory,
+            min_size=cfg.pool_min_size,
+            max_size=cfg.pool_max_size,
+            idle_timeout=cfg.pool_idle_timeout,
+            acquire_timeout=cfg.pool_acquire_timeout,
+        )
+        pool.start()
+        _agent_pool = pool
+        _invalidate_status_cache()
+        logger.info("Global AgentPool created")
+
+        return _agent_pool
 
 
 def reset_agents():
@@ -222,13 +571,21 @@ def reset_agents():
     Reset all agent instances
     Useful for testing, config changes, or memory cleanup
     """
-    global _agent_factory, _chat_agent
+    global _agent_factory, _chat_agent, _agent_pool
 
     logger.info("Resetting all global agent instances")
 
     # Clean up existing instances
-    _agent_factory = None
-    _chat_agent = None
+    with _agent_lock:
+        if _agent_pool is not None:
+            _agent_pool.close()
+        _agent_factory = None
+        _chat_agent = None
+        _agent_pool = None
+        _invalidate_status_cache()
+
+    # Force the API key to be re-read from the environment on next init
+    _resolve_api_key.cache_clear()
 
 
 def get_factory_status() -> Dict[str, Any]:
@@ -236,12 +593,17 @@ def get_factory_status() -> Dict[str, Any]:
     Get status of the global factory and agents
 
     Returns:
-        Dict[str, Any]: Status information
+        Dict[str, Any]: Status information (cached until the agents change)
     """
-    global _agent_factory, _chat_agent
-
-    return {
-        "factory_initialized": _agent_factory is not None,
-        "chat_agent_created": _chat_agent is not None,
-        "llm_info": _agent_factory.get_llm_info() if _agent_factory else None,
-    }
+    global _agent_factory, _chat_agent, _agent_pool, _status_cache
+
+    status = _status_cache
+    if status is None:
+        status = {
+            "factory_initialized": _agent_factory is not None,
+            "chat_agent_created": _chat_agent is not None,
+            "agent_pool_created": _agent_pool is not None,
+            "llm_info": _agent_factory.get_llm_info() if _agent_factory else None,
+        }
+        _status_cache = status
+    return status
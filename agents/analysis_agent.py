@@ -1,5 +1,6 @@
 # Analysis agent module - Simplified pseudocode
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 
@@ -27,7 +28,11 @@ class AnalysisAgent:
            - Check for missing values
         2. Return formatted results
         """
-        return {"status": "not_implemented"}
+        # One vectorized aggregation over all numeric columns
+        numeric = data.select_dtypes(include=np.number)
+        stats = numeric.agg(["mean", "min", "max", "std", "count"]).T
+        stats["missing"] = numeric.isna().sum().values
+        return stats.to_dict(orient="index")
     
     def detect_patterns(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -2,28 +2,221 @@
 # Purpose:GraphChatAgent should focus on understanding user intent and preparing
 # clear requests for the analytics agent, not doing the actual analytics.
 
-from typing import Dict, Any, List, Optional
-from langchain_google_genai import ChatGoogleGenerativeAI as ChatLLM
-from langchain.memory import ConversationBufferMemory
-from langgraph.graph import StateGraph, END
+from typing import (
+    Dict,
+    Any,
+    AsyncIterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+from collections import OrderedDict
+from langchain.memory.chat_memory import BaseChatMemory
+import copy
+import functools
 import logging
+import re
+import threading
+import time
 
 # Import our extracted modules
 from .models import ChatState, AgentResponse
 
 # ChatAgentTools removed - using generic tools now
-from .graph_nodes import GraphNodes
+from .graph_nodes import GraphNodes, LLM_CONCURRENCY_LIMIT
+from .memory import NOSTREAM_TAG
 from .prompts import get_prompts
 from .data_utils import DataAccessManager
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI as ChatLLM
+    from langgraph.graph import StateGraph
+
 logger = logging.getLogger(__name__)
 
 
+# Messages that can be answered without routing through the LLM supervisor
+_INTENT_PATTERNS: List[Tuple[re.Pattern, str]] = [
+    (
+        re.compile(
+            r"^(hi|hello|hey|good (morning|afternoon|evening))( there)?[\s!.]*$",
+            re.I,
+        ),
+        "greeting",
+    ),
+    (
+        re.compile(r"^(thanks|thank you|thx|cheers)( (so much|a lot))?[\s!.]*$", re.I),
+        "thanks",
+    ),
+    (re.compile(r"^/reset$", re.I), "reset"),
+]
+
+_CANNED_RESPONSES: Dict[str, str] = {
+    "greeting": "Hello! I can show you the available assets, fetch their time "
+    "series data, or calculate statistics. What would you like to explore?",
+    "thanks": "You're welcome! Let me know if there's anything else you'd like "
+    "to look at.",
+    "reset": "Conversation history cleared. What would you like to explore?",
+}
+
+
+def _prefilter_intent(message: str) -> Optional[str]:
+    """Classify trivial messages with precompiled patterns, or return None"""
+    text = message.strip()
+    for pattern, intent in _INTENT_PATTERNS:
+        if pattern.match(text):
+            return intent
+    return None
+
+
+# GraphNodes only holds per-LLM state, so agents sharing an LLM share nodes.
+# Chat models are unhashable pydantic objects, so entries are keyed by id()
+# and keep the LLM itself to confirm identity on lookup.
+_MAX_CACHED_GRAPH_NODES = 4
+_graph_nodes_cache: Dict[int, Tuple[Any, GraphNodes]] = {}
+_graph_nodes_lock = threading.Lock()
+
+
+def get_graph_nodes(
+    llm, prompts: Dict[str, str], concurrency_limit: int = LLM_CONCURRENCY_LIMIT
+) -> GraphNodes:
+    """
+    Get the shared GraphNodes for an LLM instance, creating it on first use
+
+    Args:
+        llm: Pre-initialized LLM
+        prompts (Dict[str, str]): Prompt templates
+        concurrency_limit (int): Max LLM calls in flight (applied on creation)
+
+    Returns:
+        GraphNodes: Node implementations bound to the LLM
+    """
+    with _graph_nodes_lock:
+        entry = _graph_nodes_cache.get(id(llm))
+        if entry is not None and entry[0] is llm:
+            return entry[1]
+
+        _graph_nodes_cache.pop(id(llm), None)
+        if len(_graph_nodes_cache) >= _MAX_CACHED_GRAPH_NODES:
+            _graph_nodes_cache.pop(next(iter(_graph_nodes_cache)))
+        nodes = GraphNodes(
+            llm, prompts, tools=None, concurrency_limit=concurrency_limit
+        )
+        _graph_nodes_cache[id(llm)] = (llm, nodes)
+        return nodes
+
+
+# The compiled graph is shared by every agent instance. Nodes resolve the
+# calling agent's GraphNodes and memory from the invocation config, so the
+# graph topology itself holds no per-agent state.
+def _graph_nodes(config: Dict[str, Any]) -> GraphNodes:
+    return config["configurable"]["graph_nodes"]
+
+
+def _memory(config: Dict[str, Any]):
+    return config["configurable"].get("memory")
+
+
+async def _supervisor(state: ChatState, config: Dict[str, Any]) -> ChatState:
+    return await _graph_nodes(config).supervisor_node(state, _memory(config))
+
+
+async def _rewriter(state: ChatState, config: Dict[str, Any]) -> ChatState:
+    return await _graph_nodes(config).rewriter_node(state, _memory(config))
+
+
+async def _tool_selector(state: ChatState, config: Dict[str, Any]) -> ChatState:
+    return await _graph_nodes(config).tool_selector_node(state, _memory(config))
+
+
+async def _response_generator(
+    state: ChatState, config: Dict[str, Any]
+) -> ChatState:
+    return await _graph_nodes(config).response_generator_node(
+        state, _memory(config)
+    )
+
+
+def _supervisor_router(state: ChatState, config: Dict[str, Any]) -> str:
+    return _graph_nodes(config).supervisor_router(state)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_graph() -> "StateGraph":
+    """Build the LangGraph workflow (topology is static, so built once)"""
+    # Imported lazily to keep langgraph off the module import path
+    from langgraph.graph import StateGraph, END
+
+    # Create the graph
+    workflow = StateGraph(ChatState)
+
+    # Add nodes (dispatching to the invoking agent's graph_nodes)
+    workflow.add_node("supervisor", _supervisor)
+    workflow.add_node("rewriter", _rewriter)
+    workflow.add_node("tool_selector", _tool_selector)
+    workflow.add_node("response_generator", _response_generator)
+
+    # Set entry point
+    workflow.set_entry_point("supervisor")
+
+    # Add conditional edges from supervisor
+    workflow.add_conditional_edges(
+        "supervisor",
+        _supervisor_router,
+        {
+            "rewrite": "rewriter",
+            "tools": "tool_selector",
+            "respond": "response_generator",
+            "end": END,
+        },
+    )
+
+    # Add edges from rewriter back to supervisor
+    workflow.add_edge("rewriter", "supervisor")
+
+    # Tool selector goes to response generator for memory updates and metadata
+    workflow.add_edge("tool_selector", "response_generator")
+
+    # Add edge from response generator to end
+    workflow.add_edge("response_generator", END)
+
+    return workflow
+
+
+@functools.lru_cache(maxsize=1)
+def _build_compiled_graph():
+    """Compile the workflow once; every agent reuses the compiled graph"""
+    return _build_graph().compile()
+
+
 class GraphChatAgent:
     """
     Graph-based chat agent using LangGraph with supervisor pattern
     """
 
+    __slots__ = (
+        "config",
+        "llm",
+        "memory",
+        "graph",
+        "compiled_graph",
+        "data_manager",
+        "tools_manager",
+        "graph_nodes",
+        "prompts",
+        "response_cache_ttl",
+        "is_initialized",
+    )
+
+    # Process-wide response cache keyed by (normalized message, history hash)
+    RESPONSE_CACHE_SIZE = 256
+    _response_cache: "OrderedDict[Tuple[str, int], Tuple[float, AgentResponse]]" = (
+        OrderedDict()
+    )
+    _response_cache_lock = threading.Lock()
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the graph chat agent
@@ -33,11 +226,11 @@ class GraphChatAgent:
         """
         # Extract pre-initialized components from factory
         self.config = config
-        self.llm: ChatLLM = config["llm"]
-        self.memory: ConversationBufferMemory = config["memory"]
+        self.llm: "ChatLLM" = config["llm"]
+        self.memory: BaseChatMemory = config["memory"]
 
         # Graph components
-        self.graph: Optional[StateGraph] = None
+        self.graph: Optional["StateGraph"] = None
         self.compiled_graph = None
 
         self.data_manager = DataAccessManager()
@@ -47,6 +240,9 @@ class GraphChatAgent:
         # Prompts
         self.prompts: Dict[str, str] = {}
 
+        # Seconds a cached response stays valid (tool data may change over time)
+        self.response_cache_ttl: float = config.get("response_cache_ttl", 60.0)
+
         # State
         self.is_initialized = False
 
@@ -61,70 +257,30 @@ class GraphChatAgent:
             # Create prompts first
             self.create_prompts()
 
-            # Initialize graph nodes with no specific tools (using generic API calls)
-            self.graph_nodes = GraphNodes(
-                self.llm, self.memory, self.prompts, tools=None
+            # Reuse the graph nodes shared by all agents on this LLM
+            self.graph_nodes = get_graph_nodes(
+                self.llm,
+                self.prompts,
+                self.config.get("llm_concurrency", LLM_CONCURRENCY_LIMIT),
             )
 
-            # Build graph
-            self._build_graph()
-
-            # Compile graph
-            self.compiled_graph = self.graph.compile()
+            # Build and compile the graph once per process, then reuse it
+            self.graph = _build_graph()
+            self.compiled_graph = _build_compiled_graph()
 
             self.is_initialized = True
             logger.info("GraphChatAgent initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize GraphChatAgent: {e}")
+            logger.error("Failed to initialize GraphChatAgent: %s", e)
             raise
 
-    def _build_graph(self) -> None:
-        """Build the LangGraph workflow"""
-
-        # Create the graph
-        workflow = StateGraph(ChatState)
-
-        # Add nodes using graph_nodes
-        workflow.add_node("supervisor", self.graph_nodes.supervisor_node)
-        workflow.add_node("rewriter", self.graph_nodes.rewriter_node)
-        workflow.add_node("tool_selector", self.graph_nodes.tool_selector_node)
-        workflow.add_node(
-            "response_generator", self.graph_nodes.response_generator_node
-        )
-
-        # Set entry point
-        workflow.set_entry_point("supervisor")
-
-        # Add conditional edges from supervisor
-        workflow.add_conditional_edges(
-            "supervisor",
-            self.graph_nodes.supervisor_router,
-            {
-                "rewrite": "rewriter",
-                "tools": "tool_selector",
-                "respond": "response_generator",
-                "end": END,
-            },
-        )
-
-        # Add edges from rewriter back to supervisor
-        workflow.add_edge("rewriter", "supervisor")
-
-        # Tool selector goes to response generator for memory updates and metadata
-        workflow.add_edge("tool_selector", "response_generator")
-
-        # Add edge from response generator to end
-        workflow.add_edge("response_generator", END)
-
-        self.graph = workflow
-
-    def process_message(
+    async def process_message(
         self,
         message: str,
     ) -> AgentResponse:
         """
-        Process a message through the graph
+        Process a message through the graph (non-blocking; await from an event loop)
 
         Args:
             message (str): User message
@@ -137,29 +293,186 @@ class GraphChatAgent:
                 "GraphChatAgent not initialized. Call initialize() first."
             )
 
+        cache_key = self._response_cache_key(message)
+        shortcut = await self._shortcut_response(message, cache_key)
+        if shortcut is not None:
+            return shortcut
+
         try:
-            # Create initial state
-            initial_state = ChatState(
-                original_message=message,
+            # Run the graph
+            final_state_dict = await self.compiled_graph.ainvoke(
+                ChatState(original_message=message),
+                config=self._graph_config(),
             )
+            return self._finish_response(cache_key, final_state_dict)
 
-            # Run the graph
-            final_state_dict = self.compiled_graph.invoke(initial_state)
+        except Exception as e:
+            logger.exception("Graph execution failed")
+            return self._error_response(e)
+
+    async def stream_message(
+        self,
+        message: str,
+    ) -> AsyncIterator[Union[str, AgentResponse]]:
+        """
+        Process a message through the graph, yielding the reply as it is generated
 
-            # Log final state for debugging
-            logger.info(f"Final ChatState: {final_state_dict}")
+        Args:
+            message (str): User message
 
-            # Convert to AgentResponse
-            return AgentResponse(
-                text=final_state_dict.get("final_response", ""),
-                visualizations=final_state_dict.get("visualizations", []),
-                data=final_state_dict.get("data"),
-                metadata=final_state_dict.get("metadata", {}),
+        Yields:
+            str: Response text chunks, as the response generator produces them
+            AgentResponse: The complete response, always as the last item
+        """
+        if not self.is_initialized:
+            raise RuntimeError(
+                "GraphChatAgent not initialized. Call initialize() first."
             )
 
+        cache_key = self._response_cache_key(message)
+        shortcut = await self._shortcut_response(message, cache_key)
+        if shortcut is not None:
+            yield shortcut.text
+            yield shortcut
+            return
+
+        final_state_dict: Dict[str, Any] = {}
+        streamed = False
+        try:
+            async for mode, payload in self.compiled_graph.astream(
+                ChatState(original_message=message),
+                config=self._graph_config(),
+                stream_mode=["messages", "values"],
+            ):
+                if mode == "values":
+                    final_state_dict = payload
+                    continue
+
+                # Only tokens of the user-facing answer are forwarded (not
+                # those of calls made in the node, e.g. memory summarization)
+                chunk, chunk_metadata = payload
+                if (
+                    chunk_metadata.get("langgraph_node") == "response_generator"
+                    and NOSTREAM_TAG not in (chunk_metadata.get("tags") or ())
+                    and isinstance(chunk.content, str)
+                    and chunk.content
+                ):
+                    streamed = True
+                    yield chunk.content
+
+            response = self._finish_response(cache_key, final_state_dict)
+
         except Exception as e:
-            logger.error(f"Graph execution failed: {e}")
-            return AgentResponse(
-                text="I'm sorry, I encountered an error processing your request. Please try again.",
-                metadata={"error": str(e), "type": "graph_execution_error"},
-            )
+            logger.exception("Graph execution failed")
+            response = self._error_response(e)
+
+        # Answers produced without generation (tool loop, errors) arrive whole
+        if not streamed:
+            yield response.text
+        yield response
+
+    def _graph_config(self) -> Dict[str, Any]:
+        """Per-call graph config carrying this agent's nodes and memory"""
+        return {
+            "configurable": {
+                "graph_nodes": self.graph_nodes,
+                "memory": self.memory,
+            }
+        }
+
+    async def _shortcut_response(
+        self, message: str, cache_key: Tuple[str, int]
+    ) -> Optional[AgentResponse]:
+        """Answer without the graph when possible (prefiltered or cached)"""
+        # Trivial messages (greetings, thanks, commands) never need the LLM
+        intent = _prefilter_intent(message)
+        if intent is not None:
+            return await self._canned_response(message, intent)
+
+        # Identical message in an identical conversation: skip the graph
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Returning cached response")
+            if self.memory:
+                await self.graph_nodes.update_memory(self.memory, message, cached.text)
+            return cached
+
+        return None
+
+    def _finish_response(
+        self, cache_key: Tuple[str, int], final_state_dict: Dict[str, Any]
+    ) -> AgentResponse:
+        """Convert the final graph state to an AgentResponse and cache it"""
+        # Log final state for debugging (formatting skipped unless enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final ChatState: %s", final_state_dict)
+
+        # Convert to AgentResponse
+        response = AgentResponse(
+            text=final_state_dict.get("final_response", ""),
+            visualizations=final_state_dict.get("visualizations", []),
+            data=final_state_dict.get("data"),
+            metadata=final_state_dict.get("metadata", {}),
+        )
+
+        if not (response.metadata or {}).get("error"):
+            self._cache_response(cache_key, response)
+        return response
+
+    @staticmethod
+    def _error_response(error: Exception) -> AgentResponse:
+        """Response returned when the graph run fails"""
+        return AgentResponse(
+            text="I'm sorry, I encountered an error processing your request. Please try again.",
+            metadata={"error": str(error), "type": "graph_execution_error"},
+        )
+
+    async def _canned_response(self, message: str, intent: str) -> AgentResponse:
+        """Answer a prefiltered message without running the graph"""
+        text = _CANNED_RESPONSES[intent]
+        if self.memory:
+            if intent == "reset":
+                self.memory.clear()
+            else:
+                await self.graph_nodes.update_memory(self.memory, message, text)
+
+        return AgentResponse(
+            text=text,
+            visualizations=[],
+            metadata={"intent": intent, "prefiltered": True},
+        )
+
+    def _response_cache_key(self, message: str) -> Tuple[str, int]:
+        """Build the response cache key from the message and current history"""
+        history = self.memory.chat_memory.messages if self.memory else []
+        history_hash = hash(tuple((m.type, str(m.content)) for m in history))
+        return message.strip().lower(), history_hash
+
+    def _get_cached_response(self, key: Tuple[str, int]) -> Optional[AgentResponse]:
+        """Return a fresh cached response for the key, if any"""
+        cls = type(self)
+        with cls._response_cache_lock:
+            entry = cls._response_cache.get(key)
+            if entry is None:
+                return None
+
+            cached_at, response = entry
+            if time.monotonic() - cached_at > self.response_cache_ttl:
+                del cls._response_cache[key]
+                return None
+
+            cls._response_cache.move_to_end(key)
+
+        # Callers may mutate the data frame, figures or metadata, so never
+        # hand out the cached instance itself
+        return copy.deepcopy(response)
+
+    def _cache_response(self, key: Tuple[str, int], response: AgentResponse) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        cls = type(self)
+        response = copy.deepcopy(response)
+        with cls._response_cache_lock:
+            cls._response_cache[key] = (time.monotonic(), response)
+            cls._response_cache.move_to_end(key)
+            while len(cls._response_cache) > cls.RESPONSE_CACHE_SIZE:
+                cls._response_cache.popitem(last=False)
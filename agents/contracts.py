@@ -40,7 +40,7 @@ class AnalysisRequest(BaseModel):
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResults:
     """
     Results from analysis operations
@@ -53,7 +53,7 @@ class AnalysisResults:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetInfo:
     """
     Information about an asset in the system
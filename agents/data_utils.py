@@ -3,16 +3,27 @@ Data access utilities for the Graph Chat Agent
 """
 
 import logging
+import threading
+from typing import Optional
 from backend.data.api_connector import APIConnector
 
 logger = logging.getLogger(__name__)
 
+# One connector per process: its data sources hold pooled HTTP sessions
+_shared_connector: Optional[APIConnector] = None
+_connector_lock = threading.Lock()
+
 
 class DataAccessManager:
     """Manages data access components for the chat agent"""
 
     def __init__(self):
-        self.api_connector = APIConnector()
+        global _shared_connector
+
+        with _connector_lock:
+            if _shared_connector is None:
+                _shared_connector = APIConnector()
+        self.api_connector = _shared_connector
 
     def get_components(self):
         """Return initialized data access components"""
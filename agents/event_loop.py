@@ -0,0 +1,75 @@
+"""
+Persistent event loop that runs agent work for synchronous callers
+
+Streamlit scripts have no event loop of their own. Running every turn on this
+one long-lived loop lets loop-bound resources (HTTP clients, connection pools)
+survive across turns and sessions instead of being rebuilt per message.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_agent_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared agent loop, starting its thread on first use"""
+    global _loop
+
+    loop = _loop
+    if loop is not None:
+        return loop
+
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="agent-loop", daemon=True
+            ).start()
+            _loop = loop
+            logger.info("Agent event loop started")
+        return _loop
+
+
+def is_agent_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    """Whether the given loop is the shared agent loop (never starts it)"""
+    return loop is _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the agent loop and block until it completes"""
+    return asyncio.run_coroutine_threadsafe(coro, get_agent_loop()).result()
+
+
+def iterate(stream: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Drive an async iterator on the agent loop from synchronous code
+
+    Args:
+        stream (AsyncIterator): Async iterator (e.g. an async generator)
+
+    Yields:
+        Items of the stream, in order
+    """
+
+    async def _next() -> T:
+        return await stream.__anext__()
+
+    try:
+        while True:
+            try:
+                item = run_coroutine(_next())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            run_coroutine(aclose())
@@ -2,31 +2,157 @@
 Graph node implementations for the Graph Chat Agent
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Tuple
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, Tuple
+
+import orjson
 from langchain.schema import HumanMessage, AIMessage, SystemMessage
 from .models import (
     ChatState,
     SupervisorDecision,
     RewriterResponse,
 )
-from .tools import get_tools
+from .llm_batching import BatchingLLMProxy
+from .llm_cache import ExactLLMCache
+from .memory import TokenBudgetedHistory
+from .semantic_cache import supervisor_cache
+from .tools import request_memo
+from .tools_async import get_async_tools
 from langchain_core.messages.tool import ToolMessage
-import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool calls executed concurrently per GraphNodes instance
+TOOL_CONCURRENCY_LIMIT = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "4"))
+
+# Default upper bound on LLM calls in flight per GraphNodes instance
+LLM_CONCURRENCY_LIMIT = int(os.getenv("LLM_CONCURRENCY_LIMIT", "8"))
+
+# Supervisor batches sent to the LLM concurrently
+LLM_MAX_CONCURRENT_BATCHES = int(os.getenv("LLM_MAX_CONCURRENT_BATCHES", "4"))
+
+# Tool message returned for a call repeating an earlier (name, args) pair
+DUPLICATE_CALL_MESSAGE = "duplicate call suppressed; use prior result"
+
+# Token budget for conversation history included in each prompt
+MAX_HISTORY_TOKENS = int(os.getenv("MAX_HISTORY_TOKENS", "1024"))
 
-class GraphNodes:
-    """Collection of graph node implementations"""
 
-    def __init__(self, llm, memory, prompts, tools):
-        self.llm = llm
-        self.memory = memory
+class _CrossLoopSemaphore:
+    """
+    FIFO semaphore for coroutines running on any event loop
+
+    Limits are shared by every session using the same nodes, whichever loop
+    drives them. Waiters park on a future of their own loop and a release
+    hands the slot to the oldest one via call_soon_threadsafe, so nothing
+    blocks a thread or polls
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = (
+            deque()
+        )
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    granted = False
+                except ValueError:
+                    granted = True
+            # A slot granted to a cancelled future is passed on by _grant
+            if granted and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._grant, future)
+                    return
+                except RuntimeError:
+                    # The waiter's loop has been closed; try the next one
+                    continue
+            self._value += 1
+
+    def _grant(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+
+# Blocking (sync) tools of every GraphNodes instance share one bounded pool
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=TOOL_CONCURRENCY_LIMIT, thread_name_prefix="tool"
+)
+
+
+class GraphNodes:
+    """
+    Collection of graph node implementations
+    Holds only per-LLM state; conversation memory is passed to each node call
+    so one instance can be shared by every agent using the same LLM
+    """
+
+    def __init__(
+        self, llm, prompts, tools, concurrency_limit: int = LLM_CONCURRENCY_LIMIT
+    ):
+        # Deterministic (temperature 0) calls are answered from an exact-match cache
+        self.llm = ExactLLMCache(llm)
+
+        # Supervisor classifications from concurrent sessions share one batch call
+        self._supervisor_llm = BatchingLLMProxy(
+            self.llm.with_structured_output(SupervisorDecision),
+            max_concurrent_batches=LLM_MAX_CONCURRENT_BATCHES,
+        )
+        self._rewriter_llm = self.llm.with_structured_output(RewriterResponse)
         self.prompts = prompts
-        self.tools = tools
 
-    def supervisor_node(self, state: ChatState) -> ChatState:
+        # Prompts never change, so their SystemMessages are built once and shared
+        self._system_messages = {
+            key: SystemMessage(content=prompt) for key, prompt in prompts.items()
+        }
+
+        # Tool list, name lookup and the tool-bound LLM are built once, not per turn
+        self.tools = tools or get_async_tools()
+        self._tool_map = {t.name: t for t in self.tools}
+        self._llm_with_tools = self.llm.bind_tools(self.tools)
+
+        self._history_budget = TokenBudgetedHistory(MAX_HISTORY_TOKENS)
+
+        # Caps on in-flight LLM and tool calls across every session using these nodes
+        self._llm_sem = _CrossLoopSemaphore(concurrency_limit)
+        self._tool_sem = _CrossLoopSemaphore(TOOL_CONCURRENCY_LIMIT)
+
+    async def supervisor_node(self, state: ChatState, memory=None) -> ChatState:
         """Supervisor node that makes decisions about message processing"""
         try:
             # Use current message if available, otherwise original
@@ -34,14 +160,29 @@ class GraphNodes:
 
             # Create simple messages using the centralized method
             messages = self._create_simple_messages(
-                system_prompt=self.prompts["supervisor_system"],
+                system_prompt_key="supervisor_system",
                 user_message=message_to_analyze,
                 include_history=True,
+                memory=memory,
             )
 
-            # Use structured output directly with message objects
-            llm_with_structure = self.llm.with_structured_output(SupervisorDecision)
-            decision = llm_with_structure.invoke(messages)
+            # Reuse the decision for a semantically similar message in the same context
+            # (the embedding runs in a thread, so skip the hop when it can't help)
+            context = self._history_fingerprint(memory)
+            decision = None
+            if supervisor_cache.can_hit:
+                decision = await asyncio.to_thread(
+                    supervisor_cache.get, message_to_analyze, context
+                )
+            if decision is None:
+                async with self._llm_sem:
+                    decision = await self._supervisor_llm.ainvoke(messages)
+                if supervisor_cache.enabled:
+                    await asyncio.to_thread(
+                        supervisor_cache.put, message_to_analyze, decision, context
+                    )
+            else:
+                logger.info("Supervisor decision served from semantic cache")
 
             # Update state
             state.supervisor_decision = decision
@@ -49,12 +190,14 @@ class GraphNodes:
             state.iteration_count += 1
 
             logger.info(
-                f"Supervisor decision: {decision.intent}, confidence: {decision.confidence}"
+                "Supervisor decision: %s, confidence: %s",
+                decision.intent,
+                decision.confidence,
             )
             return state
 
         except Exception as e:
-            logger.error(f"Supervisor node failed: {e}")
+            logger.error("Supervisor node failed: %s", e)
             state.supervisor_decision = SupervisorDecision(
                 intent="error",
                 confidence=0.0,
@@ -63,7 +206,7 @@ class GraphNodes:
             )
             return state
 
-    def rewriter_node(self, state: ChatState) -> ChatState:
+    async def rewriter_node(self, state: ChatState, memory=None) -> ChatState:
         """Rewriter node that clarifies ambiguous messages"""
         try:
             # Create additional context from supervisor
@@ -75,123 +218,146 @@ class GraphNodes:
 
             # Create simple messages using the centralized method
             messages = self._create_simple_messages(
-                system_prompt=self.prompts["rewriter_system"],
+                system_prompt_key="rewriter_system",
                 user_message=state.original_message,
                 additional_context=additional_context,
                 include_history=True,
+                memory=memory,
             )
 
             # Get structured response directly with message objects
-            llm_with_structure = self.llm.with_structured_output(RewriterResponse)
-            rewrite = llm_with_structure.invoke(messages)
+            async with self._llm_sem:
+                rewrite = await self._rewriter_llm.ainvoke(messages)
 
             # Update state
             state.rewriter_response = rewrite
             state.current_message = rewrite.rewritten_message
 
-            logger.info(f"Message rewritten: {rewrite.rewritten_message}")
+            logger.info("Message rewritten: %s", rewrite.rewritten_message)
             return state
 
         except Exception as e:
-            logger.error(f"Rewriter node failed: {e}")
+            logger.error("Rewriter node failed: %s", e)
             # Keep original message
             state.current_message = state.original_message
             return state
 
-    def tool_selector_node(self, state: ChatState) -> ChatState:
+    async def tool_selector_node(self, state: ChatState, memory=None) -> ChatState:
         """Reactive tool execution node - LLM can call tools iteratively"""
         try:
 
-            tools = get_tools()
-            logger.info(f"Available tools: {[t.name for t in tools]}")
+            logger.info("Available tools: %s", list(self._tool_map))
 
             # Create initial messages
             messages = self._create_simple_messages(
-                system_prompt=self.prompts["tool_selector"],
+                system_prompt_key="tool_selector",
                 user_message=state.current_message,
                 include_history=True,
+                memory=memory,
             )
 
-            # Bind tools to LLM
-            llm_with_tools = self.llm.bind_tools(tools)
-
             max_iterations = 5
             iteration = 0
             tool_results = {}
+            seen_calls = set()
+
+            # Tools in this turn share HTTP responses through a per-turn memo
+            with request_memo():
+                while iteration < max_iterations:
+                    logger.info("\n--- Iteration %d ---", iteration + 1)
+
+                    # Invoke LLM with current conversation history
+                    async with self._llm_sem:
+                        ai_response = await self._llm_with_tools.ainvoke(messages)
+                    logger.info("LLM response received")
+
+                    # If no tool calls, LLM has its final answer
+                    if not ai_response.tool_calls:
+                        logger.info("LLM provided final answer without tool calls")
+                        # Store the LLM's response in tool_results for response_generator to use
+                        tool_results["llm_final_response"] = ai_response.content
+                        state.tool_results = tool_results
+                        return state
+
+                    # LLM made tool calls, add its request to history
+                    messages.append(ai_response)
+                    logger.info(
+                        "LLM wants to call: %s",
+                        [tc["name"] for tc in ai_response.tool_calls],
+                    )
 
-            while iteration < max_iterations:
-                logger.info(f"\n--- Iteration {iteration + 1} ---")
-
-                # Invoke LLM with current conversation history
-                ai_response = llm_with_tools.invoke(messages)
-                logger.info(f"LLM response received")
-
-                # If no tool calls, LLM has its final answer
-                if not ai_response.tool_calls:
-                    logger.info("LLM provided final answer without tool calls")
-                    # Store the LLM's response in tool_results for response_generator to use
-                    tool_results["llm_final_response"] = ai_response.content
-                    state.tool_results = tool_results
-                    return state
-
-                # LLM made tool calls, add its request to history
-                messages.append(ai_response)
-                tool_names = [tc["name"] for tc in ai_response.tool_calls]
-                logger.info(f"LLM wants to call: {tool_names}")
-
-                # Execute requested tools
-                for tool_call in ai_response.tool_calls:
-                    tool_to_call = next(
-                        (t for t in tools if t.name == tool_call["name"]), None
+                    # Suppress calls already made with the same arguments
+                    fresh_calls = []
+                    for tool_call in ai_response.tool_calls:
+                        key = (
+                            tool_call["name"],
+                            orjson.dumps(
+                                tool_call["args"],
+                                option=orjson.OPT_SORT_KEYS,
+                                default=str,
+                            ),
+                        )
+                        if key not in seen_calls:
+                            seen_calls.add(key)
+                            fresh_calls.append(tool_call)
+
+                    # Execute requested tools concurrently, keeping call order
+                    outcomes = await asyncio.gather(
+                        *(
+                            self._run_tool_call(tool_call)
+                            for tool_call in fresh_calls
+                        ),
+                        return_exceptions=True,
                     )
-                    if tool_to_call:
-                        try:
-                            # Execute tool
-                            observation = tool_to_call.invoke(tool_call["args"])
-                            tool_results[tool_call["name"]] = observation
-
-                            # Log tool call details
-                            logger.info(f"Tool Call: {tool_call['name']}")
-                            logger.info(f"Tool Args: {tool_call['args']}")
-                            logger.info(f"Tool Output: {observation}")
-
-                            # Add tool result to conversation history
-                            messages.append(
-                                ToolMessage(
-                                    content=observation, tool_call_id=tool_call["id"]
-                                )
-                            )
-
-                        except Exception as tool_error:
-                            error_msg = f"Error executing {tool_call['name']}: {str(tool_error)}"
-                            logger.error(error_msg)
-                            messages.append(
-                                ToolMessage(
-                                    content=error_msg, tool_call_id=tool_call["id"]
-                                )
-                            )
-                    else:
-                        error_msg = f"Tool {tool_call['name']} not found"
-                        logger.error(error_msg)
+                    outcome_by_id = {
+                        tool_call["id"]: outcome
+                        for tool_call, outcome in zip(fresh_calls, outcomes)
+                    }
+
+                    for tool_call in ai_response.tool_calls:
+                        outcome = outcome_by_id.get(tool_call["id"])
+                        if outcome is None:
+                            succeeded = False
+                            content = DUPLICATE_CALL_MESSAGE
+                        elif isinstance(outcome, BaseException):
+                            succeeded = False
+                            content = f"Error executing {tool_call['name']}: {str(outcome)}"
+                            logger.error(content)
+                        else:
+                            succeeded, content = outcome
+
+                        if succeeded:
+                            tool_results[tool_call["name"]] = content
+
+                        # Add tool result to conversation history
                         messages.append(
-                            ToolMessage(content=error_msg, tool_call_id=tool_call["id"])
+                            ToolMessage(content=content, tool_call_id=tool_call["id"])
                         )
 
-                iteration += 1
+                    iteration += 1
+
+                    # The LLM is looping on calls it already made; stop early
+                    if not fresh_calls:
+                        logger.warning(
+                            "All tool calls were duplicates, ending tool loop"
+                        )
+                        break
 
-            # If we hit max iterations, get final response
+            # If we hit max iterations (or only got duplicates), get final response
             logger.warning(
-                f"Reached max iterations ({max_iterations}), getting final response"
-            )
-            final_response = self.llm.invoke(
-                messages
-                + [
-                    {
-                        "role": "user",
-                        "content": "Please provide your final answer based on the information gathered.",
-                    }
-                ]
+                "Tool loop stopped after %d iterations, getting final response",
+                iteration,
             )
+            async with self._llm_sem:
+                final_response = await self.llm.ainvoke(
+                    messages
+                    + [
+                        {
+                            "role": "user",
+                            "content": "Please provide your final answer based on the information gathered.",
+                        }
+                    ]
+                )
             # Store final response in tool_results for response_generator
             tool_results["llm_final_response"] = (
                 final_response.content
@@ -202,14 +368,68 @@ class GraphNodes:
             return state
 
         except Exception as e:
-            logger.error(f"Tool selector failed: {e}")
+            logger.error("Tool selector failed: %s", e)
             # Store error in tool_results for response_generator
             state.tool_results = {
                 "error": f"I encountered an error while processing your request: {str(e)}"
             }
             return state
 
-    def response_generator_node(self, state: ChatState) -> ChatState:
+    async def update_memory(self, memory, user_message: str, ai_message: str) -> None:
+        """
+        Record a turn in the conversation memory
+
+        Summarizing histories may call the LLM while adding messages, so the
+        async API is used, within the LLM concurrency limit
+        """
+        async with self._llm_sem:
+            await memory.chat_memory.aadd_messages(
+                [HumanMessage(content=user_message), AIMessage(content=ai_message)]
+            )
+
+    async def _run_tool_call(self, tool_call: dict) -> Tuple[bool, str]:
+        """Execute a single tool call on the tool executor
+
+        Returns:
+            Tuple[bool, str]: Whether the call succeeded, and its output or error
+        """
+        tool_to_call = self._tool_map.get(tool_call["name"])
+        if not tool_to_call:
+            error_msg = f"Tool {tool_call['name']} not found"
+            logger.error(error_msg)
+            return False, error_msg
+
+        try:
+            if getattr(tool_to_call, "coroutine", None) is not None:
+                # Native async tool: overlaps its I/O on the event loop
+                async with self._tool_sem:
+                    observation = await tool_to_call.ainvoke(tool_call["args"])
+            else:
+                loop = asyncio.get_running_loop()
+                observation = await loop.run_in_executor(
+                    _TOOL_EXECUTOR,
+                    functools.partial(tool_to_call.invoke, tool_call["args"]),
+                )
+
+            # Log tool call details
+            logger.info("Tool Call: %s", tool_call["name"])
+            logger.info("Tool Args: %s", tool_call["args"])
+            # Observations can be large payloads; skip rendering them when disabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Tool Output: %s", observation)
+
+            # Tools return structured dicts; the LLM gets them as compact JSON
+            if isinstance(observation, dict):
+                succeeded = "error" not in observation
+                return succeeded, orjson.dumps(observation).decode()
+            return True, str(observation)
+
+        except Exception as tool_error:
+            error_msg = f"Error executing {tool_call['name']}: {str(tool_error)}"
+            logger.error(error_msg)
+            return False, error_msg
+
+    async def response_generator_node(self, state: ChatState, memory=None) -> ChatState:
         """Generate final response based on all previous processing"""
         try:
             # Check if tool_selector already generated a final response
@@ -221,23 +441,30 @@ class GraphNodes:
                 logger.info("Using error response from tool_selector")
             else:
                 # Use the centralized method to create response messages
-                messages = self._create_response_messages(state)
-                # Generate response
-                response = self.llm.invoke(messages)
-
-                if response and hasattr(response, "content"):
-                    state.final_response = response.content
+                messages = self._create_response_messages(state, memory)
+                # Stream the response; the graph's "messages" stream mode
+                # forwards these chunks to the caller as they arrive
+                chunks = []
+                async with self._llm_sem:
+                    async for chunk in self.llm.astream(messages):
+                        if isinstance(chunk.content, str):
+                            chunks.append(chunk.content)
+                content = "".join(chunks)
+
+                if content:
+                    state.final_response = content
                     logger.info(
-                        f"Response generated successfully: {len(response.content)} characters"
+                        "Response generated successfully: %d characters", len(content)
                     )
                 else:
-                    logger.warning(f"Unexpected LLM response format: {response}")
+                    logger.warning("LLM returned an empty response")
                     state.final_response = "I apologize, but I couldn't generate a proper response. Please try again."
 
             # Update memory
-            if self.memory:
-                self.memory.chat_memory.add_user_message(state.current_message)
-                self.memory.chat_memory.add_ai_message(state.final_response)
+            if memory:
+                await self.update_memory(
+                    memory, state.current_message, state.final_response
+                )
 
             # Set metadata
             state.metadata = {
@@ -261,7 +488,7 @@ class GraphNodes:
             return state
 
         except Exception as e:
-            logger.error(f"Response generator failed: {e}")
+            logger.error("Response generator failed: %s", e)
             state.final_response = "I'm sorry, I encountered an error processing your request. Please try again."
             state.metadata = {"error": str(e)}
             return state
@@ -285,26 +512,28 @@ class GraphNodes:
 
     def _create_simple_messages(
         self,
-        system_prompt: str,
+        system_prompt_key: str,
         user_message: str,
         additional_context: str = None,
         include_history: bool = False,
         history_limit: int = 6,
         tool_results: dict = None,
+        memory=None,
     ) -> List:
         """Helper method to create simple message chains with optional conversation history and tool results"""
-        messages = [SystemMessage(content=system_prompt)]
+        messages = [self._system_messages[system_prompt_key]]
 
         # Add conversation history if requested and available
         if (
             include_history
-            and self.memory
-            and hasattr(self.memory, "chat_memory")
-            and self.memory.chat_memory.messages
+            and memory
+            and hasattr(memory, "chat_memory")
+            and memory.chat_memory.messages
         ):
-            recent_messages = self.memory.chat_memory.messages[-history_limit:]
-            for msg in recent_messages:
-                messages.append(msg)
+            recent_messages = self._history_budget.select(
+                memory.chat_memory.messages[-history_limit:]
+            )
+            messages.extend(recent_messages)
 
         # Add tool results summary if provided
         if tool_results:
@@ -321,21 +550,31 @@ class GraphNodes:
 
         return messages
 
-    def _create_response_messages(self, state: ChatState) -> List:
+    def _create_response_messages(self, state: ChatState, memory=None) -> List:
         """Helper method to create response message chains"""
         return self._create_simple_messages(
-            system_prompt=self.prompts["response_system"],
+            system_prompt_key="response_system",
             user_message=state.original_message,
             include_history=True,
             history_limit=2,  # Keep original behavior: last 1 exchange (2 messages)
             tool_results=state.tool_results,
+            memory=memory,
         )
 
+    def _history_fingerprint(self, memory=None, history_limit: int = 6) -> str:
+        """Fingerprint of the recent history, used to scope semantic cache hits"""
+        if not memory or not hasattr(memory, "chat_memory"):
+            return ""
+        recent = memory.chat_memory.messages[-history_limit:]
+        return str(hash(tuple((m.type, str(m.content)) for m in recent)))
+
     def _create_tool_summary(self, tool_results: dict) -> str:
         """Create a clean summary of tool results"""
         summaries = []
         for tool_name, result in tool_results.items():
-            # Handle each tool type
+            # Structured results are passed through as compact JSON
+            if isinstance(result, dict):
+                result = orjson.dumps(result).decode()
             summaries.append(f"{tool_name}: {result}")
 
         return "; ".join(summaries)
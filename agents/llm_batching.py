@@ -0,0 +1,125 @@
+"""
+Micro-batching proxy for LLM calls issued concurrently by different sessions
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingLLMProxy:
+    """
+    Buffers invoke() calls for up to max_wait_ms or max_batch requests and sends
+    them to the wrapped runnable as one batch() call
+
+    Collection happens on a worker thread rather than an event loop, because
+    callers may run on different event loops. Gathered batches are
+    dispatched on a thread pool so collection continues while earlier batches
+    are in flight; requests only wait for companions while batches are busy
+    """
+
+    def __init__(
+        self,
+        runnable: Any,
+        max_wait_ms: float = 20,
+        max_batch: int = 8,
+        max_concurrent_batches: int = 4,
+    ):
+        """
+        Initialize the proxy
+
+        Args:
+            runnable: LangChain runnable exposing batch()
+            max_wait_ms (float): Longest time a request waits for companions
+            max_batch (int): Largest number of requests sent together
+            max_concurrent_batches (int): Batches allowed in flight at once
+        """
+        self._runnable = runnable
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max(1, max_batch)
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self._queue: "queue.Queue[Tuple[Sequence[Any], Future]]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.max_concurrent_batches)
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._executor = None
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def invoke(self, messages: Sequence[Any]) -> Any:
+        """Submit a request and block until its batch completes"""
+        return self._submit(messages).result()
+
+    async def ainvoke(self, messages: Sequence[Any]) -> Any:
+        """Submit a request and await its batch without blocking the loop"""
+        return await asyncio.wrap_future(self._submit(messages))
+
+    def _submit(self, messages: Sequence[Any]) -> Future:
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((messages, future))
+        return future
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_batches,
+                    thread_name_prefix="llm-batch",
+                )
+                self._worker = threading.Thread(
+                    target=self._run, name="llm-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+
+            # Requests keep queueing while every slot is busy, so a saturated
+            # proxy sends larger batches instead of waiting longer
+            self._slots.acquire()
+            with self._in_flight_lock:
+                wait = self.max_wait if self._in_flight else 0
+                self._in_flight += 1
+
+            try:
+                while len(batch) < self.max_batch:
+                    batch.append(self._queue.get(block=wait > 0, timeout=wait or None))
+            except queue.Empty:
+                pass
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[Sequence[Any], Future]]) -> None:
+        try:
+            # Drop requests cancelled while queued; the rest can no longer be
+            # cancelled, so setting their results below cannot fail
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                return
+
+            inputs = [messages for messages, _ in batch]
+            if len(batch) > 1:
+                logger.debug("Dispatching LLM batch of %s", len(batch))
+
+            try:
+                results = self._runnable.batch(inputs, return_exceptions=True)
+            except Exception as e:
+                results = [e] * len(batch)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
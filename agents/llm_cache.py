@@ -0,0 +1,171 @@
+"""
+Exact-match response cache for deterministic LLM calls
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Responses keyed by the SHA-256 of the canonicalized request, shared by every
+# wrapped LLM so identical calls from different agents hit the same entry
+_CACHE_SIZE = 1024
+_cache: "OrderedDict[str, Any]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _canonical_message(message: Any) -> Any:
+    """Reduce a message (object or role dict) to JSON-serializable parts"""
+    if isinstance(message, dict):
+        return [message.get("role"), message.get("content")]
+    return [
+        message.type,
+        message.content,
+        getattr(message, "tool_calls", None),
+        getattr(message, "tool_call_id", None),
+    ]
+
+
+def _cache_key(
+    model: str, messages: Sequence[Any], structured_output: str, tools: List[str]
+) -> str:
+    """SHA-256 of the canonicalized request"""
+    payload = orjson.dumps(
+        {
+            "model": model,
+            "messages": [_canonical_message(m) for m in messages],
+            "structured_output": structured_output,
+            "tools": tools,
+        },
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def clear_llm_cache() -> None:
+    """Remove all cached responses"""
+    with _cache_lock:
+        _cache.clear()
+
+
+class _CachedRunnable:
+    """Runnable wrapper that memoizes invoke/ainvoke results"""
+
+    def __init__(
+        self,
+        runnable: Any,
+        model: str,
+        structured_output: str = "",
+        tools: Optional[List[str]] = None,
+    ):
+        self._runnable = runnable
+        self._model = model
+        self._structured_output = structured_output
+        self._tools = tools or []
+
+    def _key(self, messages: Sequence[Any]) -> Optional[str]:
+        try:
+            return _cache_key(
+                self._model, messages, self._structured_output, self._tools
+            )
+        except (TypeError, ValueError, AttributeError):
+            # Non-message input; bypass the cache
+            return None
+
+    @staticmethod
+    def _lookup(key: Optional[str]) -> Any:
+        if key is None:
+            return None
+        with _cache_lock:
+            value = _cache.get(key)
+            if value is not None:
+                _cache.move_to_end(key)
+            return value
+
+    @staticmethod
+    def _store(key: Optional[str], value: Any) -> None:
+        if key is None or value is None:
+            return
+        with _cache_lock:
+            _cache[key] = value
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    def invoke(self, messages: Sequence[Any], *args, **kwargs) -> Any:
+        key = self._key(messages)
+        cached = self._lookup(key)
+        if cached is not None:
+            logger.debug("Exact LLM cache hit")
+            return cached
+        result = self._runnable.invoke(messages, *args, **kwargs)
+        self._store(key, result)
+        return result
+
+    async def ainvoke(self, messages: Sequence[Any], *args, **kwargs) -> Any:
+        key = self._key(messages)
+        cached = self._lookup(key)
+        if cached is not None:
+            logger.debug("Exact LLM cache hit")
+            return cached
+        result = await self._runnable.ainvoke(messages, *args, **kwargs)
+        self._store(key, result)
+        return result
+
+    def batch(self, inputs: List[Sequence[Any]], *args, **kwargs) -> List[Any]:
+        keys = [self._key(messages) for messages in inputs]
+        results = [self._lookup(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            fresh = self._runnable.batch([inputs[i] for i in misses], *args, **kwargs)
+            for i, result in zip(misses, fresh):
+                results[i] = result
+                if not isinstance(result, BaseException):
+                    self._store(keys[i], result)
+        return results
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._runnable, name)
+
+
+class ExactLLMCache(_CachedRunnable):
+    """
+    Wraps a chat model so repeated identical calls return the stored response
+
+    Only active for deterministic models (temperature 0); otherwise every call
+    goes straight to the wrapped model
+    """
+
+    def __init__(self, llm: Any):
+        model = getattr(llm, "model", None) or getattr(llm, "model_name", "")
+        super().__init__(llm, str(model))
+        temperature = getattr(llm, "temperature", None)
+        self.enabled = not temperature
+
+    def _key(self, messages: Sequence[Any]) -> Optional[str]:
+        return super()._key(messages) if self.enabled else None
+
+    def with_structured_output(self, schema: Any, **kwargs) -> Any:
+        runnable = self._runnable.with_structured_output(schema, **kwargs)
+        if not self.enabled:
+            return runnable
+        return _CachedRunnable(
+            runnable,
+            self._model,
+            structured_output=getattr(schema, "__name__", str(schema)),
+        )
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs) -> Any:
+        runnable = self._runnable.bind_tools(tools, **kwargs)
+        if not self.enabled:
+            return runnable
+        return _CachedRunnable(
+            runnable,
+            self._model,
+            tools=[getattr(t, "name", str(t)) for t in tools],
+        )
@@ -0,0 +1,347 @@
+"""
+Conversation memory implementations for the Graph Chat Agent
+"""
+
+import functools
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from langchain.memory.chat_memory import BaseChatMemory
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    get_buffer_string,
+)
+
+logger = logging.getLogger(__name__)
+
+_MESSAGE_TYPES = {"human": HumanMessage, "ai": AIMessage, "system": SystemMessage}
+
+# Summaries keyed by (previous summary, summarized chunk), shared across
+# conversations so replayed flows skip the summarization LLM call
+_SUMMARY_CACHE_SIZE = 1024
+_summary_cache: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], str]" = (
+    OrderedDict()
+)
+_summary_cache_lock = threading.Lock()
+
+# Runs tagged with this are left out of LangGraph's "messages" stream, so
+# summarizer tokens never reach the user's streamed reply
+NOSTREAM_TAG = "nostream"
+
+_encoding = None
+
+
+def _get_encoding():
+    """Load the tiktoken encoding once, or None if unavailable"""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.debug("tiktoken unavailable, using estimate: %s", e)
+            _encoding = False
+    return _encoding or None
+
+
+@functools.lru_cache(maxsize=4096)
+def count_text_tokens(text: str) -> int:
+    """Approximate token count of a text (tiktoken, or ~4 characters per token)"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, len(text) // 4)
+
+
+class TokenBudgetedHistory:
+    """
+    Selects the most recent history messages that fit a token budget, dropping
+    consecutive duplicates, so prompt size stays bounded regardless of how the
+    underlying memory is configured
+    """
+
+    def __init__(self, max_history_tokens: int = 1024):
+        """
+        Initialize the selector
+
+        Args:
+            max_history_tokens (int): Token budget for history in one prompt
+        """
+        self.max_history_tokens = max_history_tokens
+
+    def select(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        """Return the newest messages (oldest first) within the token budget"""
+        selected: List[BaseMessage] = []
+        total = 0
+        previous = None
+
+        for message in reversed(messages):
+            key = (message.type, str(message.content))
+            if key == previous:
+                continue
+            previous = key
+
+            tokens = count_text_tokens(key[1])
+            if total + tokens > self.max_history_tokens:
+                break
+            selected.append(message)
+            total += tokens
+
+        selected.reverse()
+        return selected
+
+
+class TokenBoundedChatMessageHistory(BaseChatMessageHistory):
+    """
+    Chat history backed by a deque that evicts the oldest messages once the
+    total token count exceeds max_token_limit
+    """
+
+    def __init__(self, llm: Any = None, max_token_limit: int = 2000):
+        """
+        Initialize the history
+
+        Args:
+            llm: LLM used for token counting (falls back to a character estimate)
+            max_token_limit (int): Token budget for the stored messages
+        """
+        self.llm = llm
+        self.max_token_limit = max_token_limit
+        self._messages: Deque[BaseMessage] = deque()
+        self._token_counts: Deque[int] = deque()
+        self._tokens = 0
+
+        # Token counting may hit the provider API, so memoize per message
+        self._count_tokens = functools.lru_cache(maxsize=1024)(
+            self._count_tokens_uncached
+        )
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """Return the stored messages, oldest first"""
+        return list(self._messages)
+
+    @property
+    def token_count(self) -> int:
+        """Total tokens currently held in the history"""
+        return self._tokens
+
+    def add_message(self, message: BaseMessage) -> None:
+        """Append a message and evict the oldest ones beyond the token budget"""
+        tokens = self._count_tokens(message.type, str(message.content))
+        self._messages.append(message)
+        self._token_counts.append(tokens)
+        self._tokens += tokens
+
+        # Always keep the newest message, even if it alone exceeds the budget
+        while self._tokens > self.max_token_limit and len(self._messages) > 1:
+            self._messages.popleft()
+            self._tokens -= self._token_counts.popleft()
+
+    def clear(self) -> None:
+        """Remove all messages"""
+        self._messages.clear()
+        self._token_counts.clear()
+        self._tokens = 0
+
+    def _count_tokens_uncached(self, message_type: str, content: str) -> int:
+        """Count tokens for a single message"""
+        if self.llm is not None:
+            try:
+                message = _MESSAGE_TYPES[message_type](content=content)
+                return self.llm.get_num_tokens_from_messages([message])
+            except Exception as e:
+                logger.debug("Token counting failed, using estimate: %s", e)
+
+        # Rough estimate: ~4 characters per token
+        return max(1, len(content) // 4)
+
+
+class SummarizingChatMessageHistory(BaseChatMessageHistory):
+    """
+    Chat history that keeps the most recent messages verbatim and folds older
+    ones into a running LLM-generated summary
+    """
+
+    SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+    def __init__(
+        self,
+        llm: Any = None,
+        max_messages: int = 8,
+        summarize_batch: int = 4,
+        summary_prompt: Optional[str] = None,
+    ):
+        """
+        Initialize the history
+
+        Args:
+            llm: LLM used to summarize old messages
+            max_messages (int): Recent messages kept verbatim
+            summarize_batch (int): Oldest messages folded into the summary at once
+            summary_prompt (str, optional): System prompt for the summarizer
+        """
+        self.llm = llm
+        self.max_messages = max_messages
+        self.summarize_batch = max(1, min(summarize_batch, max_messages))
+        self.summary_prompt = summary_prompt or (
+            "Condense the conversation into a short summary that keeps asset "
+            "keys, measurements, time ranges and conclusions."
+        )
+        self.running_summary = ""
+        self._recent: Deque[BaseMessage] = deque()
+
+        # Summaries run inside graph nodes and inherit their callbacks
+        self._summary_llm = (
+            llm.with_config(tags=[NOSTREAM_TAG]) if llm is not None else None
+        )
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """Return the summary (as context) followed by the recent messages"""
+        if not self.running_summary:
+            return list(self._recent)
+        return [AIMessage(content=self.SUMMARY_PREFIX + self.running_summary)] + list(
+            self._recent
+        )
+
+    def add_message(self, message: BaseMessage) -> None:
+        """Append a message, summarizing the oldest ones when over the limit"""
+        self._recent.append(message)
+        while (chunk := self._pop_overflow()) is not None:
+            self.running_summary = self._summarize(self.running_summary, chunk)
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Append messages, summarizing with the async LLM API when over the limit"""
+        self._recent.extend(messages)
+        while (chunk := self._pop_overflow()) is not None:
+            self.running_summary = await self._asummarize(
+                self.running_summary, chunk
+            )
+
+    def clear(self) -> None:
+        """Remove the summary and all messages"""
+        self.running_summary = ""
+        self._recent.clear()
+
+    def _pop_overflow(self) -> Optional[Tuple[Tuple[str, str], ...]]:
+        """Remove the oldest batch of messages if over the limit, else None"""
+        if len(self._recent) <= self.max_messages:
+            return None
+        return tuple(
+            (m.type, str(m.content))
+            for m in (self._recent.popleft() for _ in range(self.summarize_batch))
+        )
+
+    def _summarize(
+        self, previous: str, chunk: Tuple[Tuple[str, str], ...]
+    ) -> str:
+        """Fold a chunk of messages into the summary, reusing cached results"""
+        cached = _cached_summary(previous, chunk)
+        if cached is not None:
+            return cached
+
+        summary = None
+        if self._summary_llm is not None:
+            try:
+                response = self._summary_llm.invoke(self._summary_messages(previous, chunk))
+                summary = str(response.content)
+            except Exception as e:
+                logger.warning("Summarization failed, keeping raw transcript: %s", e)
+
+        return _store_summary(previous, chunk, summary)
+
+    async def _asummarize(
+        self, previous: str, chunk: Tuple[Tuple[str, str], ...]
+    ) -> str:
+        """Async variant of _summarize that never blocks the event loop"""
+        cached = _cached_summary(previous, chunk)
+        if cached is not None:
+            return cached
+
+        summary = None
+        if self._summary_llm is not None:
+            try:
+                response = await self._summary_llm.ainvoke(
+                    self._summary_messages(previous, chunk)
+                )
+                summary = str(response.content)
+            except Exception as e:
+                logger.warning("Summarization failed, keeping raw transcript: %s", e)
+
+        return _store_summary(previous, chunk, summary)
+
+    def _summary_messages(
+        self, previous: str, chunk: Tuple[Tuple[str, str], ...]
+    ) -> List[BaseMessage]:
+        """Build the summarizer prompt for a chunk of messages"""
+        return [
+            SystemMessage(content=self.summary_prompt),
+            HumanMessage(
+                content=f"Current summary:\n{previous or '(none)'}\n\n"
+                f"New messages:\n{_transcript(chunk)}"
+            ),
+        ]
+
+
+def _transcript(chunk: Tuple[Tuple[str, str], ...]) -> str:
+    return "\n".join(f"{role}: {content}" for role, content in chunk)
+
+
+def _cached_summary(
+    previous: str, chunk: Tuple[Tuple[str, str], ...]
+) -> Optional[str]:
+    """Return the stored summary for (previous, chunk), if any"""
+    key = (previous, chunk)
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+        if cached is not None:
+            _summary_cache.move_to_end(key)
+        return cached
+
+
+def _store_summary(
+    previous: str, chunk: Tuple[Tuple[str, str], ...], summary: Optional[str]
+) -> str:
+    """Cache a summary (the raw transcript if summarization failed) and return it"""
+    if summary is None:
+        summary = f"{previous}\n{_transcript(chunk)}".strip()
+
+    with _summary_cache_lock:
+        _summary_cache[(previous, chunk)] = summary
+        while len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+    return summary
+
+
+class BoundedBufferMemory(BaseChatMemory):
+    """Buffer memory whose history is bounded (by tokens or by summarization)"""
+
+    memory_key: str = "chat_history"
+    human_prefix: str = "Human"
+    ai_prefix: str = "AI"
+
+    @property
+    def memory_variables(self) -> List[str]:
+        """Memory variables exposed to chains"""
+        return [self.memory_key]
+
+    def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the (bounded) history"""
+        messages = self.chat_memory.messages
+        if self.return_messages:
+            return {self.memory_key: messages}
+
+        return {
+            self.memory_key: get_buffer_string(
+                messages, human_prefix=self.human_prefix, ai_prefix=self.ai_prefix
+            )
+        }
+
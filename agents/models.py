@@ -2,10 +2,12 @@
 Pydantic models for the Graph Chat Agent
 """
 
-from typing import Dict, Any, List, Optional, Literal
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Literal, TYPE_CHECKING
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class SupervisorDecision(BaseModel):
@@ -39,11 +41,12 @@ class RewriterResponse(BaseModel):
     )
 
 
-
-class ChatState(BaseModel):
+# Plain slotted dataclass: nodes mutate the state on every step, which needs
+# no validation (the LLM-structured fields above are validated on creation)
+@dataclass(slots=True)
+class ChatState:
     """State that flows through the graph"""
 
-    model_config = {"arbitrary_types_allowed": True}
     # Input
     original_message: str
 
@@ -51,11 +54,11 @@ class ChatState(BaseModel):
     current_message: str = ""
     supervisor_decision: Optional[SupervisorDecision] = None
     rewriter_response: Optional[RewriterResponse] = None
-    tool_results: Dict[str, Any] = Field(default_factory=dict)
+    tool_results: Dict[str, Any] = field(default_factory=dict)
 
     # Output
     final_response: str = ""
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     # Flow control
     next_node: str = ""
     iteration_count: int = 0
@@ -68,5 +71,5 @@ class AgentResponse:
 
     text: str
     visualizations: List = None
-    data: Optional[pd.DataFrame] = None
+    data: Optional["pd.DataFrame"] = None
     metadata: Dict[str, Any] = None
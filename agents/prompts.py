@@ -2,9 +2,12 @@
 Prompt templates for the Graph Chat Agent
 """
 
+import functools
 
+
+@functools.lru_cache(maxsize=1)
 def get_prompts() -> dict:
-    """Return all prompt templates used by the chat agent"""
+    """Return all prompt templates used by the chat agent (built once, treat as read-only)"""
     return {
         "supervisor_system": """You are a supervisor agent that classifies user intent for a time series analysis assistant.
             Your job is to analyze user messages and determine their intent without needing specific data context.
@@ -70,4 +73,7 @@ def get_prompts() -> dict:
             - If you discover you need information the user hasn't provided (like specific asset names), ask for clarification in a natural way
 
             Remember: You can see the available tools and their descriptions. Use them reactively based on what you learn from each tool call to progressively answer the user's question.""",
+        "memory_summary": """Condense the conversation into a short running summary for a time series analysis assistant.
+            Merge the current summary with the new messages. Keep asset keys, measurement names, time ranges, numeric results and conclusions; drop greetings and filler.
+            Respond with the updated summary only.""",
     }
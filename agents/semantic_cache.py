@@ -0,0 +1,177 @@
+"""
+Semantic cache for structured LLM decisions
+
+Maps a user message to a previously computed result when a cached message is
+close enough in embedding space, so paraphrased repeats ("show machines" vs
+"list my machines") skip the LLM round-trip
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_NAME = os.getenv("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+
+_model = None
+_model_lock = threading.Lock()
+_model_unavailable = False
+
+
+def _get_model():
+    """Load the sentence-transformers model once, or None if unavailable"""
+    global _model, _model_unavailable
+    if _model is not None or _model_unavailable:
+        return _model
+
+    with _model_lock:
+        if _model is None and not _model_unavailable:
+            try:
+                # Optional dependency: without it the cache is a no-op
+                from sentence_transformers import SentenceTransformer
+
+                _model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            except Exception as e:
+                logger.warning("Semantic cache disabled: %s", e)
+                _model_unavailable = True
+    return _model
+
+
+class SemanticCache:
+    """
+    In-memory cache keyed by embedding cosine similarity
+
+    Entries are only compared within the same context string (e.g. a
+    fingerprint of the recent conversation), since the same message can mean
+    different things after different histories
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600,
+        max_entries: int = 1024,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            threshold (float): Minimum cosine similarity for a hit
+            ttl (float): Seconds an entry stays valid
+            max_entries (int): Oldest entries are dropped beyond this size
+            enabled (bool): When False, get() and put() do nothing
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None
+        self._contexts: List[str] = []
+        self._values: List[Any] = []
+        self._timestamps: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is switched on and the embedding model is usable"""
+        return self._enabled and not _model_unavailable
+
+    @property
+    def can_hit(self) -> bool:
+        """Cheap pre-check: a get() could only return a value if this is True"""
+        return self.enabled and len(self._values) > 0
+
+    def get(self, text: str, context: str = "") -> Optional[Any]:
+        """Return the cached value for a semantically similar text, if any"""
+        if not self.enabled:
+            return None
+        embedding = self._encode(text)
+        if embedding is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            if self._embeddings is None or not len(self._values):
+                return None
+
+            # Embeddings are normalized, so the dot product is the cosine
+            scores = self._embeddings @ embedding
+            for index in np.argsort(scores)[::-1]:
+                if scores[index] < self.threshold:
+                    break
+                if (
+                    self._contexts[index] == context
+                    and now - self._timestamps[index] <= self.ttl
+                ):
+                    logger.debug("Semantic cache hit (score=%.3f)", scores[index])
+                    return self._values[index]
+        return None
+
+    def put(self, text: str, value: Any, context: str = "") -> None:
+        """Store a value for a text"""
+        if not self.enabled:
+            return
+        embedding = self._encode(text)
+        if embedding is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            if self._embeddings is None:
+                self._embeddings = embedding[np.newaxis, :]
+            else:
+                self._embeddings = np.vstack([self._embeddings, embedding])
+            self._contexts.append(context)
+            self._values.append(value)
+            self._timestamps.append(now)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._embeddings = None
+            self._contexts.clear()
+            self._values.clear()
+            self._timestamps.clear()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries and the oldest ones beyond max_entries"""
+        # Leave room for the entry about to be added
+        keep_count = max(self.max_entries - 1, 0)
+        keep = [i for i, ts in enumerate(self._timestamps) if now - ts <= self.ttl]
+        keep = keep[max(len(keep) - keep_count, 0) :]
+        if len(keep) == len(self._values):
+            return
+
+        self._embeddings = self._embeddings[keep] if keep else None
+        self._contexts = [self._contexts[i] for i in keep]
+        self._values = [self._values[i] for i in keep]
+        self._timestamps = [self._timestamps[i] for i in keep]
+
+    @staticmethod
+    def _encode(text: str) -> Optional[np.ndarray]:
+        """Embed a text as a normalized float32 vector"""
+        model = _get_model()
+        if model is None:
+            return None
+        return np.asarray(
+            model.encode(text.strip().lower(), normalize_embeddings=True),
+            dtype=np.float32,
+        )
+
+
+# Only intent decisions are cached: rewrites carry entities (asset keys, dates,
+# measurements) that near-duplicate messages do not share
+supervisor_cache = SemanticCache(
+    threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92")),
+    enabled=os.getenv("SEMANTIC_CACHE_ENABLED", "1") != "0",
+)
@@ -2,55 +2,290 @@
 Tool implementations using @tool decorator
 """
 
+import functools
+import numpy as np
+import orjson
 import requests
 import logging
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Union
-from config.settings import API_CONFIG
+from typing import Dict, Any, Iterator, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config.settings import get_config
 from langchain.tools import tool
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session so tool calls reuse pooled connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Without a timeout a stalled API would hang the tool (and the chat turn) forever
+def _timeout() -> float:
+    """Request timeout from the API config, read on use so imports stay lazy"""
+    return get_config().get("timeout", 10)
+
+
+# The data API samples every 5 minutes
+_SAMPLING_INTERVAL = 5 * 60
+
+
+# Parsed responses memoized for the duration of one agent turn, so tools called
+# in the same tool loop (e.g. statistics per measurement) share a fetch
+_HTTP_MEMO: ContextVar[Optional[Dict[tuple, Any]]] = ContextVar(
+    "http_cache", default=None
+)
+
+
+@contextmanager
+def request_memo() -> Iterator[Dict[tuple, Any]]:
+    """Scope a fresh HTTP response memo to the enclosed block"""
+    memo: Dict[tuple, Any] = {}
+    token = _HTTP_MEMO.set(memo)
+    try:
+        yield memo
+    finally:
+        _HTTP_MEMO.reset(token)
+
+
+def _memo_lookup(endpoint: str, params: Dict[str, Any]) -> Optional[Any]:
+    """Return a memoized response body for this request, if any"""
+    memo = _HTTP_MEMO.get()
+    if memo is None:
+        return None
+    return memo.get((endpoint, tuple(sorted(params.items()))))
+
+
+def _memo_store(endpoint: str, params: Dict[str, Any], data: Any) -> None:
+    """Memoize a response body for the current turn"""
+    memo = _HTTP_MEMO.get()
+    if memo is not None:
+        memo[(endpoint, tuple(sorted(params.items())))] = data
+
+
+def _endpoint_path(endpoint: str) -> str:
+    """Path of an API endpoint relative to the base URL"""
+    return get_config()["endpoints"][endpoint]["path"]
+
+
+def _endpoint_url(endpoint: str) -> str:
+    """Full URL of an API endpoint"""
+    return get_config()["base_url"] + _endpoint_path(endpoint)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date_to_ts(date_str: str) -> int:
+    """Convert a YYYY-MM-DD date (local midnight) to a Unix timestamp"""
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        # Fixed layout: slicing avoids strptime's format parser
+        dt = datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+    else:
+        dt = datetime.strptime(date_str, "%Y-%m-%d")
+    return int(dt.timestamp())
+
+
+def _default_end_ts() -> int:
+    """
+    Current time rounded down to the server's sampling grid, so default-range
+    requests made by different tools (or a second apart) share a memo key
+    """
+    now = int(time.time())
+    return now - now % _SAMPLING_INTERVAL
+
+
+def _timeseries_params(
+    asset_key: str, start_date: Union[str, int] = None, end_date: Union[str, int] = None
+) -> Dict[str, Any]:
+    """Build /timeseries query parameters, defaulting to the last 24 hours"""
+    params = {"asset_key": asset_key}
+
+    # Handle default dates (24 hours ago to now)
+    if start_date is None and end_date is None:
+        end_timestamp = _default_end_ts()
+        start_timestamp = end_timestamp - (24 * 60 * 60)  # 24 hours ago
+    else:
+        # Convert provided dates to Unix timestamps
+        if start_date is not None:
+            if isinstance(start_date, str):
+                start_timestamp = _parse_date_to_ts(start_date)
+            else:
+                start_timestamp = start_date
+        else:
+            start_timestamp = _default_end_ts() - (24 * 60 * 60)
+
+        if end_date is not None:
+            if isinstance(end_date, str):
+                end_timestamp = _parse_date_to_ts(end_date)
+            else:
+                end_timestamp = end_date
+        else:
+            end_timestamp = _default_end_ts()
+
+    params["start_date"] = start_timestamp
+    params["end_date"] = end_timestamp
+    return params
+
+
+def _format_assets(assets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Structure the /scan response for the LLM"""
+    total_assets = len(assets)
+    truncated = total_assets > 5
+
+    result = {
+        "summary": f"Found {total_assets} available assets",
+        "total": total_assets,
+        "shown": [
+            {
+                "key": asset["key"],
+                "name": asset["name"],
+                "location": asset["location"],
+                "type": asset["classification"],
+            }
+            for asset in assets[:5]
+        ],
+        "truncated": truncated,
+    }
+    if truncated:
+        result["hint"] = "Use get_timeseries with specific asset_key to access data."
+    return result
+
+
+def _series_values(series: Dict[str, Any]) -> np.ndarray:
+    """
+    Values of one measurement, from either response shape: parallel arrays
+    ({"t": [...], "v": [...]}) or the legacy timestamp -> value map
+    """
+    if "v" in series:
+        return np.asarray(series["v"], dtype=np.float64)
+    return np.fromiter(series.values(), dtype=np.float64, count=len(series))
+
+
+def _format_timeseries(asset_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Structure the /timeseries response for the LLM"""
+    measurements = data.get("data", [])
+
+    if not measurements:
+        return {
+            "asset_key": asset_key,
+            "summary": f"No data found for asset {asset_key}",
+        }
+
+    data_points = {}
+    for measurement in measurements:
+        measurement_type = next(iter(measurement))
+        series = measurement[measurement_type]
+        data_points[measurement_type] = len(series["v"] if "v" in series else series)
+
+    return {
+        "asset_key": asset_key,
+        "summary": f"Retrieved {len(measurements)} measurement types for asset {asset_key}",
+        "data_points": data_points,
+    }
+
+
+def _format_statistics(
+    asset_key: str, data: Dict[str, Any], measurement_type: str = None
+) -> Dict[str, Any]:
+    """Compute statistics from a /timeseries response"""
+    measurements = data.get("data", [])
+
+    if not measurements:
+        return {
+            "asset_key": asset_key,
+            "summary": f"No data available for asset {asset_key}",
+        }
+
+    statistics = {}
+    for measurement in measurements:
+        measure_name = next(iter(measurement))
+
+        # Skip if specific measurement requested and this isn't it
+        if measurement_type and measure_name != measurement_type:
+            continue
+
+        values = _series_values(measurement[measure_name])
+        if values.size:
+            std = values.std(ddof=1) if values.size > 1 else 0.0
+
+            statistics[measure_name] = {
+                "count": int(values.size),
+                "mean": round(float(values.mean()), 2),
+                "min": round(float(values.min()), 2),
+                "max": round(float(values.max()), 2),
+                "std": round(float(std), 2),
+            }
+
+    return {
+        "asset_key": asset_key,
+        "summary": f"Statistical analysis for asset {asset_key}",
+        "statistics": statistics,
+    }
+
+
+def _format_last_value(asset_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Structure the /lastvalue response for the LLM"""
+    if not data:
+        return {
+            "asset_key": asset_key,
+            "summary": f"No recent data found for asset {asset_key}",
+        }
+
+    # Parse the LastValueResponse format: {asset_id, data, timestamp}
+    asset_id = data.get("asset_id", asset_key)
+    measurements = data.get("data", {})
+    timestamp = data.get("timestamp")
+
+    if not measurements:
+        return {
+            "asset_key": asset_key,
+            "summary": f"No measurement data found for asset {asset_key}",
+        }
+
+    result = {
+        "asset_id": asset_id,
+        "summary": f"Latest values for asset {asset_id}",
+        "values": measurements,
+    }
+    if timestamp:
+        # Convert timestamp to readable format
+        result["timestamp"] = datetime.fromtimestamp(timestamp).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+    return result
+
 
 @tool
-def get_data() -> str:
+def get_data() -> Dict[str, Any]:
     """Get list of all available assets/machines/sensors. Use this when user asks about available data or assets.
 
     Args:
         None - no arguments required
     """
     try:
-        url = API_CONFIG["base_url"] + API_CONFIG["endpoints"]["scan"]["path"]
-        response = requests.get(url)
+        response = _SESSION.get(_endpoint_url("scan"), timeout=_timeout())
 
         if response.status_code == 200:
-            assets = response.json()
-            total_assets = len(assets)
-
-            if total_assets > 5:
-                displayed_assets = assets[:5]
-                result = f"Found {total_assets} available assets (showing first 5):\n"
-                for asset in displayed_assets:
-                    result += f"- {asset['key']}: {asset['name']} at {asset['location']} (Type: {asset['classification']})\n"
-                result += f"\nMetadata: {total_assets - 5} additional assets available. Use get_timeseries with specific asset_key to access data."
-            else:
-                result = f"Found {total_assets} available assets:\n"
-                for asset in assets:
-                    result += f"- {asset['key']}: {asset['name']} at {asset['location']} (Type: {asset['classification']})\n"
-
-            return result
+            return _format_assets(orjson.loads(response.content))
         else:
-            return f"Error fetching assets: HTTP {response.status_code}"
+            return {"error": f"Error fetching assets: HTTP {response.status_code}"}
     except Exception as e:
         logger.error(f"get_data failed: {e}")
-        return f"Error getting data: {str(e)}"
+        return {"error": f"Error getting data: {str(e)}"}
 
 
 @tool
 def get_timeseries(
     asset_key: str, start_date: Union[str, int] = None, end_date: Union[str, int] = None
-) -> str:
+) -> Dict[str, Any]:
     """Get time series data for a specific asset. Use this when user asks for data from a specific asset.
 
     Args:
@@ -59,155 +294,82 @@ def get_timeseries(
         end_date (str|int): OPTIONAL - End timestamp (Unix timestamp or YYYY-MM-DD format, defaults to now)
     """
     try:
-        url = API_CONFIG["base_url"] + API_CONFIG["endpoints"]["timeseries"]["path"]
-        params = {"asset_key": asset_key}
-
-        # Handle default dates (24 hours ago to now)
-        if start_date is None and end_date is None:
-            end_timestamp = int(time.time())
-            start_timestamp = end_timestamp - (24 * 60 * 60)  # 24 hours ago
-        else:
-            # Convert provided dates to Unix timestamps
-            if start_date is not None:
-                if isinstance(start_date, str):
-
-                    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                    start_timestamp = int(start_dt.timestamp())
-                else:
-                    start_timestamp = start_date
-            else:
-                start_timestamp = int(time.time()) - (24 * 60 * 60)
-
-            if end_date is not None:
-                if isinstance(end_date, str):
-                    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-                    end_timestamp = int(end_dt.timestamp())
-                else:
-                    end_timestamp = end_date
-            else:
-                end_timestamp = int(time.time())
-
-        params["start_date"] = start_timestamp
-        params["end_date"] = end_timestamp
-
-        response = requests.get(url, params=params)
-
-        if response.status_code == 200:
-            data = response.json()
-            measurements = data.get("data", [])
-
-            if not measurements:
-                return f"No data found for asset {asset_key}"
-
-            result = f"Retrieved {len(measurements)} measurement types for asset {asset_key}:\n"
-            for measurement in measurements:
-                measurement_type = list(measurement.keys())[0]
-                data_points = len(measurement[measurement_type])
-                result += f"- {measurement_type}: {data_points} data points\n"
-
-            return result
-        else:
-            return f"Error fetching timeseries: HTTP {response.status_code}"
+        params = _timeseries_params(asset_key, start_date, end_date)
+        data = _memo_lookup("timeseries", params)
+        if data is None:
+            response = _SESSION.get(
+                _endpoint_url("timeseries"), params=params, timeout=_timeout()
+            )
+            if response.status_code != 200:
+                return {
+                    "error": f"Error fetching timeseries: HTTP {response.status_code}"
+                }
+            data = orjson.loads(response.content)
+            _memo_store("timeseries", params, data)
+
+        return _format_timeseries(asset_key, data)
     except Exception as e:
         logger.error(f"get_timeseries failed: {e}")
-        return f"Error getting timeseries data: {str(e)}"
+        return {"error": f"Error getting timeseries data: {str(e)}"}
 
 
 @tool
-def get_statistics(asset_key: str, measurement_type: str = None) -> str:
+def get_statistics(
+    asset_key: str,
+    measurement_type: str = None,
+    start_date: Union[str, int] = None,
+    end_date: Union[str, int] = None,
+) -> Dict[str, Any]:
     """Get statistical analysis of time series data for an asset.
 
     Args:
         asset_key (str): REQUIRED - The unique identifier for the asset
         measurement_type (str): OPTIONAL - Specific measurement to analyze (e.g., 'temperature', 'pressure')
+        start_date (str|int): OPTIONAL - Start timestamp (Unix timestamp or YYYY-MM-DD format, defaults to 24 hours ago)
+        end_date (str|int): OPTIONAL - End timestamp (Unix timestamp or YYYY-MM-DD format, defaults to now)
     """
     try:
-        # First get the timeseries data
-        url = API_CONFIG["base_url"] + API_CONFIG["endpoints"]["timeseries"]["path"]
-        params = {"asset_key": asset_key}
-        response = requests.get(url, params=params)
-
-        if response.status_code != 200:
-            return f"Error fetching data for statistics: HTTP {response.status_code}"
-
-        data = response.json()
-        measurements = data.get("data", [])
-
-        if not measurements:
-            return f"No data available for asset {asset_key}"
-
-        result = f"Statistical analysis for asset {asset_key}:\n"
-
-        for measurement in measurements:
-            measure_name = list(measurement.keys())[0]
-
-            # Skip if specific measurement requested and this isn't it
-            if measurement_type and measure_name != measurement_type:
-                continue
-
-            values = list(measurement[measure_name].values())
-            if values:
-                import statistics
-
-                result += f"\n{measure_name}:\n"
-                result += f"  - Count: {len(values)}\n"
-                result += f"  - Mean: {statistics.mean(values):.2f}\n"
-                result += f"  - Min: {min(values):.2f}\n"
-                result += f"  - Max: {max(values):.2f}\n"
-                result += f"  - Std Dev: {statistics.stdev(values):.2f}\n"
-
-        return result
+        # First get the timeseries data (same request as get_timeseries, so a
+        # statistics call after a timeseries call reuses the memoized fetch)
+        params = _timeseries_params(asset_key, start_date, end_date)
+        data = _memo_lookup("timeseries", params)
+        if data is None:
+            response = _SESSION.get(
+                _endpoint_url("timeseries"), params=params, timeout=_timeout()
+            )
+            if response.status_code != 200:
+                return {
+                    "error": f"Error fetching data for statistics: HTTP {response.status_code}"
+                }
+            data = orjson.loads(response.content)
+            _memo_store("timeseries", params, data)
+
+        return _format_statistics(asset_key, data, measurement_type)
     except Exception as e:
         logger.error(f"get_statistics failed: {e}")
-        return f"Error calculating statistics: {str(e)}"
+        return {"error": f"Error calculating statistics: {str(e)}"}
 
 
 @tool
-def get_last_value(asset_key: str) -> str:
+def get_last_value(asset_key: str) -> Dict[str, Any]:
     """Get the most recent data point for a specific asset. Use this when user asks for current values or latest readings.
 
     Args:
         asset_key (str): REQUIRED - The unique identifier for the asset (e.g., 'ABC123')
     """
     try:
-        url = API_CONFIG["base_url"] + API_CONFIG["endpoints"]["lastvalue"]["path"]
         params = {"asset_key": asset_key}
-        response = requests.get(url, params=params)
+        response = _SESSION.get(
+            _endpoint_url("lastvalue"), params=params, timeout=_timeout()
+        )
 
         if response.status_code == 200:
-            data = response.json()
-
-            if not data:
-                return f"No recent data found for asset {asset_key}"
-
-            # Parse the LastValueResponse format: {asset_id, data, timestamp}
-            asset_id = data.get("asset_id", asset_key)
-            measurements = data.get("data", {})
-            timestamp = data.get("timestamp")
-
-            if not measurements:
-                return f"No measurement data found for asset {asset_key}"
-
-            result = f"Latest values for asset {asset_id}:\n"
-
-            for measurement_type, value in measurements.items():
-                result += f"- {measurement_type}: {value}\n"
-
-            if timestamp:
-                # Convert timestamp to readable format
-                from datetime import datetime
-
-                readable_time = datetime.fromtimestamp(timestamp).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-                result += f"\nTimestamp: {readable_time}"
-
-            return result
+            return _format_last_value(asset_key, orjson.loads(response.content))
         else:
-            return f"Error fetching last value: HTTP {response.status_code}"
+            return {"error": f"Error fetching last value: HTTP {response.status_code}"}
     except Exception as e:
         logger.error(f"get_last_value failed: {e}")
-        return f"Error getting last value: {str(e)}"
+        return {"error": f"Error getting last value: {str(e)}"}
 
 
 def get_tools():
@@ -0,0 +1,175 @@
+"""
+Async tool implementations using @tool decorator
+
+Mirrors agents/tools.py with non-blocking httpx calls, so concurrent tool calls
+overlap their HTTP waits on the event loop instead of occupying threads
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+import httpx
+import orjson
+from langchain.tools import tool
+
+from config.settings import get_config
+from .event_loop import is_agent_loop
+from .tools import (
+    _endpoint_path,
+    _format_assets,
+    _format_last_value,
+    _format_statistics,
+    _format_timeseries,
+    _memo_lookup,
+    _memo_store,
+    _timeseries_params,
+    _timeout,
+)
+
+logger = logging.getLogger(__name__)
+
+_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# httpx clients are bound to the event loop they were first used on. The app
+# runs agents on the persistent agent loop, which owns one long-lived client;
+# calls from any other loop get a client closed when the call finishes.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=get_config()["base_url"], timeout=_timeout(), limits=_LIMITS
+    )
+
+
+@asynccontextmanager
+async def _client_session() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield an AsyncClient usable on the running event loop"""
+    global _client
+
+    if is_agent_loop(asyncio.get_running_loop()):
+        if _client is None:
+            _client = _new_client()
+        yield _client
+        return
+
+    async with _new_client() as client:
+        yield client
+
+
+@tool
+async def get_data() -> Dict[str, Any]:
+    """Get list of all available assets/machines/sensors. Use this when user asks about available data or assets.
+
+    Args:
+        None - no arguments required
+    """
+    try:
+        async with _client_session() as client:
+            response = await client.get(_endpoint_path("scan"))
+
+        if response.status_code == 200:
+            return _format_assets(orjson.loads(response.content))
+        else:
+            return {"error": f"Error fetching assets: HTTP {response.status_code}"}
+    except Exception as e:
+        logger.error("get_data failed: %s", e)
+        return {"error": f"Error getting data: {str(e)}"}
+
+
+@tool
+async def get_timeseries(
+    asset_key: str, start_date: Union[str, int] = None, end_date: Union[str, int] = None
+) -> Dict[str, Any]:
+    """Get time series data for a specific asset. Use this when user asks for data from a specific asset.
+
+    Args:
+        asset_key (str): REQUIRED - The unique identifier for the asset (e.g., 'ABC123')
+        start_date (str|int): OPTIONAL - Start timestamp (Unix timestamp or YYYY-MM-DD format, defaults to 24 hours ago)
+        end_date (str|int): OPTIONAL - End timestamp (Unix timestamp or YYYY-MM-DD format, defaults to now)
+    """
+    try:
+        params = _timeseries_params(asset_key, start_date, end_date)
+        data = _memo_lookup("timeseries", params)
+        if data is None:
+            async with _client_session() as client:
+                response = await client.get(
+                    _endpoint_path("timeseries"), params=params
+                )
+            if response.status_code != 200:
+                return {
+                    "error": f"Error fetching timeseries: HTTP {response.status_code}"
+                }
+            data = orjson.loads(response.content)
+            _memo_store("timeseries", params, data)
+
+        return _format_timeseries(asset_key, data)
+    except Exception as e:
+        logger.error("get_timeseries failed: %s", e)
+        return {"error": f"Error getting timeseries data: {str(e)}"}
+
+
+@tool
+async def get_statistics(
+    asset_key: str,
+    measurement_type: str = None,
+    start_date: Union[str, int] = None,
+    end_date: Union[str, int] = None,
+) -> Dict[str, Any]:
+    """Get statistical analysis of time series data for an asset.
+
+    Args:
+        asset_key (str): REQUIRED - The unique identifier for the asset
+        measurement_type (str): OPTIONAL - Specific measurement to analyze (e.g., 'temperature', 'pressure')
+        start_date (str|int): OPTIONAL - Start timestamp (Unix timestamp or YYYY-MM-DD format, defaults to 24 hours ago)
+        end_date (str|int): OPTIONAL - End timestamp (Unix timestamp or YYYY-MM-DD format, defaults to now)
+    """
+    try:
+        # First get the timeseries data (same request as get_timeseries, so a
+        # statistics call after a timeseries call reuses the memoized fetch)
+        params = _timeseries_params(asset_key, start_date, end_date)
+        data = _memo_lookup("timeseries", params)
+        if data is None:
+            async with _client_session() as client:
+                response = await client.get(
+                    _endpoint_path("timeseries"), params=params
+                )
+            if response.status_code != 200:
+                return {
+                    "error": f"Error fetching data for statistics: HTTP {response.status_code}"
+                }
+            data = orjson.loads(response.content)
+            _memo_store("timeseries", params, data)
+
+        return _format_statistics(asset_key, data, measurement_type)
+    except Exception as e:
+        logger.error("get_statistics failed: %s", e)
+        return {"error": f"Error calculating statistics: {str(e)}"}
+
+
+@tool
+async def get_last_value(asset_key: str) -> Dict[str, Any]:
+    """Get the most recent data point for a specific asset. Use this when user asks for current values or latest readings.
+
+    Args:
+        asset_key (str): REQUIRED - The unique identifier for the asset (e.g., 'ABC123')
+    """
+    try:
+        params = {"asset_key": asset_key}
+        async with _client_session() as client:
+            response = await client.get(_endpoint_path("lastvalue"), params=params)
+
+        if response.status_code == 200:
+            return _format_last_value(asset_key, orjson.loads(response.content))
+        else:
+            return {"error": f"Error fetching last value: HTTP {response.status_code}"}
+    except Exception as e:
+        logger.error("get_last_value failed: %s", e)
+        return {"error": f"Error getting last value: {str(e)}"}
+
+
+def get_async_tools():
+    """Return list of available async tools"""
+    return [get_data, get_timeseries, get_statistics, get_last_value]
@@ -12,7 +12,8 @@ DEFAULT_CONFIG = {
     },
     "model_name": "gemini-2.5-flash",
     "temperature": 0.0,
-    "max_tokens": 2000
+    "max_tokens": 2000,
+    "llm_concurrency": 8
 }
 
 def main():
@@ -1,5 +1,6 @@
 # Anomaly detection module - Simplified pseudocode
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 
@@ -21,11 +22,13 @@ class AnomalyDetector:
         2. Find values outside 1.5*IQR bounds
         3. Return boolean series of outliers
         """
-        Q1 = series.quantile(0.25)
-        Q3 = series.quantile(0.75)
+        values = series.to_numpy(dtype=np.float64, copy=False)
+        # One percentile call partitions the data once for both quartiles
+        Q1, Q3 = np.nanpercentile(values, [25, 75])
         IQR = Q3 - Q1
         
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
         
-        return (series < lower_bound) | (series > upper_bound)
+        outliers = np.less(values, lower_bound) | np.greater(values, upper_bound)
+        return pd.Series(outliers, index=series.index)
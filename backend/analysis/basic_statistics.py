@@ -1,5 +1,6 @@
 # Basic statistics module - Simplified pseudocode
 
+import numpy as np
 import pandas as pd
 from typing import Dict
 
@@ -16,10 +17,30 @@ class BasicStatistics:
         1. Calculate min, max, mean, std, median
         2. Return as dictionary
         """
+        values = series.to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]  # pandas reductions skip NaN
+        n = values.size
+
+        if n == 0:
+            return {key: np.nan for key in ("min", "max", "mean", "std", "median")}
+
+        mean = np.add.reduce(values) / n
+        # Centered second pass keeps the variance numerically stable
+        deviations = values - mean
+        std = np.sqrt(np.dot(deviations, deviations) / (n - 1)) if n > 1 else np.nan
+
+        # Partial sort around the middle instead of a full sort
+        mid = n // 2
+        if n % 2:
+            median = np.partition(values, mid)[mid]
+        else:
+            lower, upper = np.partition(values, [mid - 1, mid])[mid - 1 : mid + 1]
+            median = (lower + upper) / 2
+
         return {
-            "min": series.min(),
-            "max": series.max(), 
-            "mean": series.mean(),
-            "std": series.std(),
-            "median": series.median(),
+            "min": float(np.minimum.reduce(values)),
+            "max": float(np.maximum.reduce(values)),
+            "mean": float(mean),
+            "std": float(std),
+            "median": float(median),
         }
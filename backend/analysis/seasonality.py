@@ -1,11 +1,44 @@
-# Seasonality detection module - Simplified pseudocode
+# Seasonality detection module - FFT autocorrelation based
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the peak search then runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _find_acf_peak(acf: np.ndarray, min_lag: int) -> Tuple[int, float]:
+    """
+    Highest autocorrelation peak after the initial decay from lag 0
+
+    Returns (-1, 0.0) when no candidate lag exists
+    """
+    limit = acf.size // 2
+    lag = max(min_lag, 1)
+
+    # Skip the monotone decay away from lag 0
+    while lag < limit and acf[lag] <= acf[lag - 1]:
+        lag += 1
+
+    best_lag = -1
+    best_value = 0.0
+    for i in range(lag, limit):
+        if best_lag == -1 or acf[i] > best_value:
+            best_lag = i
+            best_value = acf[i]
+    return best_lag, best_value
+
 
 class SeasonalityDetector:
     """
-    Simplified seasonality detection for time series data
+    Seasonality detection for time series data
     """
 
     def __init__(self, default_period: int = 24):
@@ -15,16 +48,36 @@ class SeasonalityDetector:
     def detect_basic_patterns(self, series: pd.Series) -> Dict[str, Any]:
         """
         Basic pattern detection
-        
-        Pseudocode:
-        1. Check for daily patterns (24 hour cycle)
-        2. Check for weekly patterns (7 day cycle)  
-        3. Return simple pattern information
+
+        1. Compute the autocorrelation with one rfft/irfft pair (Wiener-Khinchin)
+        2. Take the strongest peak after the initial decay as the period
+        3. Flag seasonality when its autocorrelation exceeds 2/sqrt(N)
         """
-        return {
-            "has_seasonality": False,  # Placeholder
+        result = {
+            "has_seasonality": False,
             "period": self.default_period,
             "strength": 0.0,
-            "method": "simplified",
-            "status": "not_implemented"
+            "method": "acf_fft",
         }
+
+        x = series.dropna().to_numpy(dtype=np.float64)
+        n = x.size
+        if n < 4:
+            return result
+
+        x = x - x.mean()
+        spectrum = np.fft.rfft(x, n=2 * n)  # zero-padded: linear, not circular
+        acf = np.fft.irfft(spectrum * np.conj(spectrum))[:n]
+        if acf[0] <= 0:
+            # Constant series: no variance, no periodicity
+            return result
+        acf /= acf[0]
+
+        period, strength = _find_acf_peak(acf, 2)
+        if period == -1:
+            return result
+
+        result["period"] = int(period)
+        result["strength"] = float(strength)
+        result["has_seasonality"] = bool(strength > 2 / np.sqrt(n))
+        return result
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import pandas as pd
 from datetime import datetime
+import orjson
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -67,9 +71,10 @@ class RESTDataSource(DataSource):
     def _setup_session(self):
         """Setup the session with authentication and headers"""
         if self.config.auth_type == "basic":
-            self.session.auth = HTTPBasicAuth(
-                self.config.username, self.config.password
-            )
+            # Encode the credentials once rather than on every request
+            credentials = f"{self.config.username}:{self.config.password}"
+            token = base64.b64encode(credentials.encode("latin1")).decode("ascii")
+            self.session.headers.update({"Authorization": f"Basic {token}"})
         elif self.config.auth_type == "api_key":
             self.session.headers.update(
                 {"Authorization": f"Bearer {self.config.api_key}"}
@@ -77,6 +82,17 @@ class RESTDataSource(DataSource):
 
         self.session.headers.update(self.config.headers)
 
+        # Pool keep-alive connections and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def connect(self) -> bool:
         """Establish connection to the REST API"""
         try:
@@ -118,8 +134,8 @@ class RESTDataSource(DataSource):
             )
             response.raise_for_status()
 
-            data = response.json()
-            df = pd.DataFrame(data)
+            data = orjson.loads(response.content)
+            df = pd.DataFrame.from_records(data)
             df["datetime"] = pd.to_datetime(df["datetime"])
             df.set_index("datetime", inplace=True)
 
@@ -177,6 +193,10 @@ class APIConnector:
 
     def validate_all_connections(self) -> Dict[str, bool]:
         """Validate connections to all data sources"""
-        return {
-            name: source.validate_connection() for name, source in self.sources.items()
-        }
+        # Each check is a blocking round-trip; run them concurrently
+        with ThreadPoolExecutor(max_workers=min(32, len(self.sources) or 1)) as executor:
+            futures = {
+                name: executor.submit(source.validate_connection)
+                for name, source in self.sources.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
@@ -1,14 +1,37 @@
 # Data loading module - Simplified for API-only access
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
+from config.settings import get_config
+
 class DataLoader:
     """
     Simplified data loader for API-based time series data
     """
-    
+
+    def __init__(self, schema: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the loader
+
+        Args:
+            schema: Optional record schema with "columns" (list), "dtypes"
+                (column -> dtype) and "default_dtype" (for undeclared
+                columns; Arrow float64 if omitted). Defaults to the timeseries
+                endpoint schema in API_CONFIG, or no declared columns if the
+                config file is missing
+        """
+        if schema is None:
+            try:
+                schema = get_config()['endpoints']['timeseries'].get('schema', {})
+            except FileNotFoundError:
+                schema = {}
+        self.columns = schema.get('columns') or None
+        self.dtypes = schema.get('dtypes', {})
+        self.default_dtype = schema.get('default_dtype', 'float64[pyarrow]')
+
     def process_api_response(self, api_data: Dict[str, Any]) -> pd.DataFrame:
         """
         Process API response into pandas DataFrame
@@ -20,10 +43,23 @@ class DataLoader:
             pd.DataFrame: Processed time series data
         """
         # Convert API response to DataFrame
-        df = pd.DataFrame(api_data['data'])
-        df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
-        df.set_index('datetime', inplace=True)
-        df.drop('timestamp', axis=1, inplace=True)
+        df = pd.DataFrame.from_records(
+            api_data['data'], columns=self.columns, coerce_float=True
+        )
+        # Declared (or default) dtypes skip pandas' per-value type inference;
+        # measurements stay Arrow-backed (compact, zero-copy buffers)
+        dtypes = {
+            col: self.dtypes.get(col, self.default_dtype) for col in df.columns
+        }
+        dtypes['timestamp'] = self.dtypes.get('timestamp', 'int64')
+        df = df.astype(dtypes, copy=False)
+        # Timestamps are whole seconds: scale to ns and reinterpret as datetime64
+        ts = df['timestamp'].to_numpy(dtype=np.int64)
+        index = pd.DatetimeIndex(
+            (ts * 1_000_000_000).view('datetime64[ns]'), name='datetime'
+        )
+        df = df.drop(columns='timestamp')
+        df.index = index
         return df
     
     def validate_time_series(self, df: pd.DataFrame) -> bool:
@@ -37,6 +73,9 @@ class DataLoader:
             bool: True if valid time series, False otherwise
         """
         # Basic validation: has datetime index and numeric columns
-        return (hasattr(df.index, 'dtype') and 
-                'datetime' in str(df.index.dtype) and
-                len(df.select_dtypes(include=['number']).columns) > 0)
\ No newline at end of file
+        # bool counts as numeric for pandas but not for select_dtypes('number')
+        return pd.api.types.is_datetime64_any_dtype(df.index) and any(
+            pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            for dtype in df.dtypes
+        )
\ No newline at end of file
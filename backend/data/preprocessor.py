@@ -6,6 +6,25 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Optional
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; DataFrame.ffill is used without it
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _ffill_2d(values: np.ndarray) -> None:
+        """Forward-fill NaNs down each column of a float matrix, in place"""
+        for j in prange(values.shape[1]):
+            last = values[0, j]
+            for i in range(values.shape[0]):
+                if np.isnan(values[i, j]):
+                    values[i, j] = last
+                else:
+                    last = values[i, j]
+
 
 class TimeSeriesPreprocessor:
     """
@@ -24,6 +43,11 @@ class TimeSeriesPreprocessor:
         self.scaler = MinMaxScaler()
         self.train_data_pct = 0.05
 
+        # Set by fit() and reused by every later preprocess() call
+        self._fitted = False
+        self._continuous_cols: List[str] = []
+        self._pca: Optional[PCA] = None
+
     def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Handle missing values in the dataframe
@@ -34,71 +58,138 @@ class TimeSeriesPreprocessor:
         Returns:
             pd.DataFrame: Dataframe with handled missing values
         """
+        # One NaN scan over the whole block, then a single drop
+        na_counts = df.isna().to_numpy().sum(axis=0)
+        sparse_cols = df.columns[na_counts > 0.20 * len(df)]
+        df = df.drop(columns=sparse_cols)
+
+        # A single-dtype NumPy float block is filled by the parallel kernel
+        dtypes = set(df.dtypes)
+        if (
+            njit is not None
+            and len(df)
+            and len(dtypes) == 1
+            and all(isinstance(d, np.dtype) and d.kind == "f" for d in dtypes)
+        ):
+            values = df.to_numpy(copy=True)
+            _ffill_2d(values)
+            return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+        return df.ffill()
+
+    def _prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Handle missing values and coerce object columns to numeric"""
+        #  handle missing values
+        df = self.handle_missing_values(df)
+
+        # convert columns to numeric data type if possible
         for col in df.columns:
-            if df[col].isna().sum() > 0.20 * len(df):
-                df.drop(columns=[col], inplace=True)
-        df = df.ffill()
+            if df[col].dtype == "object" or pd.api.types.is_string_dtype(df[col]):
+                try:
+                    df[col] = pd.to_numeric(df[col], errors="coerce")
+                except ValueError:
+                    pass
+
         return df
 
-    def preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, df: pd.DataFrame) -> "TimeSeriesPreprocessor":
         """
-        Preprocess the time series data
+        Fit the column selection, scaler and PCA on the time series data
 
         Args:
             df (pd.DataFrame): Raw time series data
 
         Returns:
-            pd.DataFrame: Preprocessed data
+            TimeSeriesPreprocessor: The fitted preprocessor
         """
-        #  handle missing values
-        df = self.handle_missing_values(df)
-
-        # convert columns to numeric data type if possible
-        for col in df.columns:
-            if df[col].dtype == "object":
-                try:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-                except ValueError:
-                    pass
+        self._fit_prepared(self._prepare(df))
+        return self
 
+    def _fit_prepared(self, df: pd.DataFrame) -> None:
+        """Fit on a frame that has already been through _prepare"""
         # remove binary columns
         num_cols = df.select_dtypes(include=[np.number]).columns
-        binary_cols = [col for col in num_cols if df[col].nunique() < 3]
-        continuous_cols = [col for col in num_cols if col not in binary_cols]
+        # One vectorized nunique over all numeric columns
+        binary_mask = df[num_cols].nunique(dropna=True).lt(3).to_numpy()
+        continuous_cols = list(num_cols[~binary_mask])
 
-        train_data = df[continuous_cols].iloc[0 : int(len(df) * self.train_data_pct)]
+        # float32 halves the bytes the scaler and PCA work through; this also
+        # converts Arrow-backed columns to NumPy, which sklearn requires
+        features = df[continuous_cols].astype(np.float32)
+        train_data = features.iloc[0 : int(len(df) * self.train_data_pct)]
 
         # scale data
         scaler = self.scaler.fit(train_data)
-        scaled_data = pd.DataFrame(
-            scaler.transform(df[continuous_cols]),
-            columns=train_data.columns,
-            index=df.index,
-        )
 
         #  pca
-        if len(scaled_data.columns) > 3:
+        pca = None
+        # The randomized probe needs no more components than samples or features
+        n_probe = min(len(train_data), len(continuous_cols), 6)
+        if len(continuous_cols) > 3 and n_probe >= 1:
             scaled_train_data = pd.DataFrame(
                 scaler.transform(train_data[continuous_cols]),
                 columns=train_data.columns,
             )
             explained_variance_ratio = 0.90
-            temp_pca = PCA()
+            # At most 3 components are kept, so a few leading singular vectors
+            # (randomized SVD) are enough to locate the variance threshold
+            temp_pca = PCA(
+                n_components=n_probe,
+                svd_solver="randomized",
+                random_state=0,
+            )
             temp_pca.fit(scaled_train_data)
             explained_variance_ratio_cumsum = np.cumsum(
                 temp_pca.explained_variance_ratio_
             )
+            reached = explained_variance_ratio_cumsum >= explained_variance_ratio
             n_components = (
-                np.argmax(explained_variance_ratio_cumsum >= explained_variance_ratio)
-                + 1
+                np.argmax(reached) + 1 if reached.any() else len(reached)
             )
 
             if n_components > 3:
                 n_components = 3
 
-            pca = PCA(n_components=n_components)
-            principal_components = pca.fit_transform(scaled_data)
-            col_names = [f"PC_{i}" for i in range(n_components)]
+            pca = PCA(
+                n_components=n_components, svd_solver="randomized", random_state=0
+            )
+            pca.fit(scaler.transform(features))
+
+        self._continuous_cols = continuous_cols
+        self._pca = pca
+        self._fitted = True
+
+    def preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Preprocess the time series data (fitting on the first call only)
+
+        Args:
+            df (pd.DataFrame): Raw time series data
+
+        Returns:
+            pd.DataFrame: Preprocessed data
+        """
+        df = self._prepare(df)
+
+        # Repeated calls (e.g. on a growing stream) reuse the fitted scaler/PCA
+        if not self._fitted:
+            self._fit_prepared(df)
+        else:
+            missing = [col for col in self._continuous_cols if col not in df.columns]
+            if missing:
+                raise ValueError(
+                    f"Data is missing columns the preprocessor was fitted on: {missing}"
+                )
+
+        scaled_data = pd.DataFrame(
+            self.scaler.transform(df[self._continuous_cols].astype(np.float32)),
+            columns=self._continuous_cols,
+            index=df.index,
+        )
+
+        if self._pca is not None:
+            principal_components = self._pca.transform(scaled_data.to_numpy())
+            col_names = [f"PC_{i}" for i in range(self._pca.n_components)]
             scaled_data = pd.DataFrame(
                 principal_components, columns=col_names, index=scaled_data.index
             )
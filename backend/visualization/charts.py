@@ -2,12 +2,74 @@
 
 import pandas as pd
 import matplotlib.pyplot as plt
-import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from typing import Dict, Any, List, Optional, Tuple
+import warnings
 import numpy as np
 
 
+def _correlation_matrix(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pearson correlation of the numeric columns
+
+    Gap-free frames go through a single float32 np.corrcoef call; frames with
+    missing values keep pandas' pairwise-complete semantics
+    """
+    numeric = df.select_dtypes(include=[np.number])
+    arr = np.ascontiguousarray(
+        numeric.to_numpy(dtype=np.float32, na_value=np.nan)
+    )
+    if arr.shape[1] == 0 or np.isnan(arr).any():
+        return numeric.corr()
+
+    # Constant columns have no correlation; leave them NaN like pandas does
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Without dtype, corrcoef upcasts to float64
+        matrix = np.corrcoef(arr, rowvar=False, dtype=np.float32).reshape(
+            arr.shape[1], arr.shape[1]
+        )
+    return pd.DataFrame(matrix, index=numeric.columns, columns=numeric.columns)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Returns the indices of `threshold` points that preserve the visual shape
+    of the series (first and last points are always kept)
+    """
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    bucket_size = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    selected = 0
+    with warnings.catch_warnings():
+        # All-NaN buckets are allowed; they simply pick their first point
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for i in range(threshold - 2):
+            start = int(i * bucket_size) + 1
+            end = int((i + 1) * bucket_size) + 1
+            next_end = min(int((i + 2) * bucket_size) + 1, n)
+
+            # Average of the next bucket is the third vertex of the triangle
+            avg_x = x[end:next_end].mean()
+            avg_y = np.nanmean(y[end:next_end])
+
+            areas = np.abs(
+                (x[selected] - avg_x) * (y[start:end] - y[selected])
+                - (x[selected] - x[start:end]) * (avg_y - y[selected])
+            )
+            selected = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+            indices[i + 1] = selected
+
+    return indices
+
+
 class TimeSeriesCharts:
     """
     Class for creating time series visualizations
@@ -23,6 +85,8 @@ class TimeSeriesCharts:
         self.config = config or {}
         self.default_height = self.config.get("default_height", 500)
         self.default_width = self.config.get("default_width", 800)
+        # Series longer than this are LTTB-downsampled before rendering
+        self.max_points = self.config.get("max_points", 5000)
         self.colors = {
             "primary": "#1f77b4",  # Blue
             "secondary": "#ff7f0e",  # Orange
@@ -33,6 +97,20 @@ class TimeSeriesCharts:
             "highlight": "#e377c2",  # Pink
         }
 
+    def _downsample(
+        self, index: pd.Index, values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Downsample a series to at most max_points with LTTB"""
+        if len(values) <= self.max_points:
+            return index.to_numpy(), values
+
+        if isinstance(index, pd.DatetimeIndex):
+            x = index.asi8.astype(np.float64)
+        else:
+            x = np.arange(len(index), dtype=np.float64)
+        keep = _lttb_indices(x, values.astype(np.float64), self.max_points)
+        return index.to_numpy()[keep], values[keep]
+
     def create_line_chart(
         self,
         df: pd.DataFrame,
@@ -63,11 +141,12 @@ class TimeSeriesCharts:
         # Create figure
         fig = go.Figure()
 
-        # Add line trace
+        # Add line trace (WebGL, downsampled for long series)
+        x, y = self._downsample(df.index, df[column].to_numpy())
         fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df[column],
+            go.Scattergl(
+                x=x,
+                y=y,
                 mode="lines",
                 name=column,
                 line=dict(color=self.colors["primary"], width=2),
@@ -95,7 +174,7 @@ class TimeSeriesCharts:
         title: str = "",
         height: int = None,
         width: int = None,
-    ) -> px.line:
+    ) -> go.Figure:
         """
         Create a chart highlighting anomalies in time series data by extending the multi-line chart
 
@@ -108,7 +187,7 @@ class TimeSeriesCharts:
             width (int, optional): Chart width
 
         Returns:
-            px.line: Plotly Express line chart with anomalies marked
+            go.Figure: Multi-line chart with anomalies marked
         """
 
         # Reuse the multi-line chart function to create the base chart
@@ -120,20 +199,32 @@ class TimeSeriesCharts:
             width=width,
         )
 
-        # Add vertical lines for anomalies
-        if anomalies is not None and any(anomalies):
-            # Get timestamps where anomalies is True
-            anomaly_timestamps = df.index[anomalies]
-
-            # Add vertical lines for each anomaly
-            for timestamp in anomaly_timestamps:
-                fig.add_vline(
-                    x=timestamp,
-                    line_color=self.colors["anomaly"],
-                    line_width=1,
-                    line_dash="dash",
+        if anomalies is None:
+            return fig
+
+        # One pass to find the anomaly positions; nothing to draw without any
+        anomaly_positions = np.flatnonzero(np.asarray(anomalies, dtype=bool))
+        if anomaly_positions.size:
+            anomaly_timestamps = df.index.to_numpy()[anomaly_positions]
+
+            # Draw every anomaly line in one WebGL trace: each line is a
+            # (ymin, ymax) segment, separated from the next by a NaN gap
+            values = df[columns].to_numpy(dtype=np.float64)
+            ymin, ymax = np.nanmin(values), np.nanmax(values)
+            xs = np.repeat(anomaly_timestamps, 3)
+            ys = np.tile([ymin, ymax, np.nan], len(anomaly_timestamps))
+
+            fig.add_trace(
+                go.Scattergl(
+                    x=xs,
+                    y=ys,
+                    mode="lines",
+                    line=dict(color=self.colors["anomaly"], width=1, dash="dash"),
                     opacity=0.7,
+                    showlegend=False,
+                    hoverinfo="skip",
                 )
+            )
 
         return fig
 
@@ -144,9 +235,9 @@ class TimeSeriesCharts:
         title: str = "",
         height: int = None,
         width: int = None,
-    ) -> px.line:
+    ) -> go.Figure:
         """
-        Create a multi-line chart for multiple time series using plotly.express
+        Create a multi-line chart for multiple time series
 
         Args:
             df (pd.DataFrame): Time series data
@@ -156,35 +247,25 @@ class TimeSeriesCharts:
             width (int, optional): Chart width
 
         Returns:
-            px.line: Plotly Express line chart
+            go.Figure: Plotly figure with one line per column
         """
         height = height or self.default_height
         width = width or self.default_width
 
-        # Create a long-format dataframe for plotly express
-        plot_df = df[columns].copy()
-        plot_df.index.name = "timestamp"  # Name the index
-        plot_df = plot_df.reset_index().melt(
-            id_vars="timestamp",
-            value_vars=columns,
-            var_name="variable",
-            value_name="value",
-        )
+        columns = columns or list(df.columns)
 
-        # Create figure with plotly express
-        fig = px.line(
-            plot_df,
-            x="timestamp",
-            y="value",
-            color="variable",
+        # One WebGL trace per column (no melt copy), each downsampled on its own
+        fig = go.Figure()
+        for col in columns:
+            x, y = self._downsample(df.index, df[col].to_numpy())
+            fig.add_trace(go.Scattergl(x=x, y=y, mode="lines", name=col))
+
+        # Set layout
+        fig.update_layout(
             title=title,
             height=height,
             width=width,
             template="plotly_white",
-        )
-
-        # Update layout
-        fig.update_layout(
             xaxis_title="Time",
             yaxis_title="Value",
             hovermode="x unified",
@@ -195,6 +276,190 @@ class TimeSeriesCharts:
 
         return fig
 
+    def create_statistics_chart(
+        self,
+        df: pd.DataFrame,
+        column: str,
+        window: int = 24,
+        stats: List[str] = None,
+        title: str = "",
+        height: int = None,
+        width: int = None,
+        rolling: Optional[pd.DataFrame] = None,
+    ) -> go.Figure:
+        """
+        Create a chart of a series with its rolling statistics
+
+        Args:
+            df (pd.DataFrame): Time series data
+            column (str): Column name to visualize
+            window (int): Rolling window size
+            stats (List[str], optional): Rolling statistics to plot
+            title (str): Chart title
+            height (int, optional): Chart height
+            width (int, optional): Chart width
+            rolling (pd.DataFrame, optional): Precomputed rolling statistics
+
+        Returns:
+            go.Figure: Plotly figure object
+        """
+        stats = stats or ["mean", "std"]
+        if rolling is None:
+            rolling = df[column].rolling(window).agg(stats)
+
+        fig = go.Figure()
+        x = df.index.to_numpy()
+        fig.add_trace(
+            go.Scattergl(
+                x=x,
+                y=df[column].to_numpy(),
+                mode="lines",
+                name=column,
+                line=dict(color=self.colors["primary"], width=1),
+            )
+        )
+        stat_colors = [self.colors["secondary"], self.colors["trend"]]
+        for i, stat in enumerate(stats):
+            fig.add_trace(
+                go.Scattergl(
+                    x=x,
+                    y=rolling[stat].to_numpy(),
+                    mode="lines",
+                    name=f"Rolling {stat}",
+                    line=dict(color=stat_colors[i % len(stat_colors)], width=2),
+                )
+            )
+
+        fig.update_layout(
+            title=title or f"Rolling Statistics: {column}",
+            xaxis_title="Time",
+            yaxis_title=column,
+            height=height or self.default_height,
+            width=width or self.default_width,
+            hovermode="x unified",
+            template="plotly_white",
+        )
+
+        return fig
+
+    def create_heatmap(
+        self,
+        df: pd.DataFrame,
+        column: str = None,
+        title: str = "",
+        height: int = None,
+        width: int = None,
+        corr: Optional[pd.DataFrame] = None,
+        max_lag: int = 24,
+    ) -> go.Figure:
+        """
+        Create a correlation heatmap
+
+        Without a column this is the feature correlation matrix; with a column
+        it is the correlation between lagged copies of that column
+
+        Args:
+            df (pd.DataFrame): Time series data
+            column (str, optional): Column for an autocorrelation heatmap
+            title (str): Chart title
+            height (int, optional): Chart height
+            width (int, optional): Chart width
+            corr (pd.DataFrame, optional): Precomputed feature correlation matrix
+            max_lag (int): Largest lag for the autocorrelation heatmap
+
+        Returns:
+            go.Figure: Plotly figure object
+        """
+        if column is None:
+            matrix = corr
+            if matrix is None:
+                matrix = _correlation_matrix(df)
+        else:
+            lags = range(min(max_lag, max(len(df) - 1, 0)) + 1)
+            matrix = pd.concat(
+                {f"lag_{lag}": df[column].shift(lag) for lag in lags}, axis=1
+            ).corr()
+
+        labels = [str(label) for label in matrix.columns]
+        fig = go.Figure(
+            go.Heatmap(
+                z=matrix.to_numpy(),
+                x=labels,
+                y=labels,
+                colorscale="RdBu",
+                zmin=-1,
+                zmax=1,
+            )
+        )
+        fig.update_layout(
+            title=title,
+            height=height or self.default_height,
+            width=width or self.default_width,
+            template="plotly_white",
+        )
+
+        return fig
+
+    def create_seasonality_chart(
+        self,
+        components: Dict[str, pd.Series],
+        title: str = "",
+        height: int = None,
+        width: int = None,
+    ) -> go.Figure:
+        """
+        Create stacked charts of decomposed time series components
+
+        Args:
+            components (Dict[str, pd.Series]): Components such as trend, seasonal, residual
+            title (str): Chart title
+            height (int, optional): Chart height
+            width (int, optional): Chart width
+
+        Returns:
+            go.Figure: Plotly figure object
+        """
+        fig = make_subplots(
+            rows=len(components),
+            cols=1,
+            shared_xaxes=True,
+            subplot_titles=[name.capitalize() for name in components],
+        )
+        for row, (name, series) in enumerate(components.items(), start=1):
+            fig.add_trace(
+                go.Scattergl(
+                    x=series.index.to_numpy(),
+                    y=series.to_numpy(),
+                    mode="lines",
+                    name=name,
+                    line=dict(color=self.colors.get(name, self.colors["primary"])),
+                ),
+                row=row,
+                col=1,
+            )
+
+        fig.update_layout(
+            title=title,
+            height=height or self.default_height,
+            width=width or self.default_width,
+            showlegend=False,
+            template="plotly_white",
+        )
+
+        return fig
+
+    def _precompute(
+        self, df: pd.DataFrame, column: str, window: int
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Derive the rolling statistics and correlation matrix shared by the
+        dashboard charts, so each is computed once per dashboard
+        """
+        return {
+            "rolling": df[column].rolling(window).agg(["mean", "std"]),
+            "corr": _correlation_matrix(df),
+        }
+
     def create_dashboard(
         self,
         df: pd.DataFrame,
@@ -217,11 +482,12 @@ class TimeSeriesCharts:
             Dict[str, go.Figure]: Dictionary of plotly figures
         """
         dashboard = {}
+        precomputed = self._precompute(df, column, window)
 
         # 1. Time series with anomalies
-        if anomalies is not None and any(anomalies):
+        if anomalies is not None and anomalies.any():
             dashboard["anomaly_chart"] = self.create_anomaly_chart(
-                df, column, anomalies, title=f"Anomaly Detection: {column}"
+                df, [column], anomalies, title=f"Anomaly Detection: {column}"
             )
         else:
             dashboard["main_chart"] = self.create_line_chart(
@@ -235,6 +501,7 @@ class TimeSeriesCharts:
             window,
             stats=["mean", "std"],
             title=f"Rolling Statistics: {column} (Window: {window})",
+            rolling=precomputed["rolling"],
         )
 
         # 3. Seasonality chart if components available
@@ -245,7 +512,7 @@ class TimeSeriesCharts:
 
         # 4. Correlation heatmap
         dashboard["correlation"] = self.create_heatmap(
-            df, title="Feature Correlation Matrix"
+            df, title="Feature Correlation Matrix", corr=precomputed["corr"]
         )
 
         # 5. Autocorrelation for the column
@@ -1,11 +1,14 @@
 """
 Configuration settings loader
 """
-import json
+import functools
+import mmap
 import os
 from typing import Dict, Any
 from pathlib import Path
 
+import orjson
+
 
 def load_api_config() -> Dict[str, Any]:
     """Load API configuration from JSON file"""
@@ -14,9 +17,22 @@ def load_api_config() -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"API config file not found: {config_path}")
     
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    # orjson parses straight from the memory-mapped file bytes
+    with open(config_path, 'rb') as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        return orjson.loads(mm)
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Dict[str, Any]:
+    """Return the API configuration, loading it on first access"""
+    return load_api_config()
 
 
-# Load config once at module level
-API_CONFIG = load_api_config()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: `from config.settings import API_CONFIG` still works,
+    # but the file is only read when the name is first accessed
+    if name == "API_CONFIG":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
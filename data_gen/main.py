@@ -1,14 +1,31 @@
-from fastapi import FastAPI, HTTPException, Query, Path, Depends
+from fastapi import FastAPI, HTTPException, Query, Path, Depends, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Literal, Optional, Dict, Any, Set, Tuple, Union
+import functools
+import hashlib
+import os
 import random
 import time
 from datetime import datetime, timedelta
 import math
 import string
+import threading
 from enum import Enum
 
-app = FastAPI(title="Asset Data Server", version="2.0.0")
+import numpy as np
+import orjson
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the series are then computed with NumPy
+    njit = None
+
+# orjson serializes the large /timeseries payloads much faster than json.dumps
+app = FastAPI(title="Asset Data Server", version="2.0.0", default_response_class=ORJSONResponse)
+# Timeseries payloads are highly repetitive and compress several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Enums for validation
 class Classification(str, Enum):
@@ -37,9 +54,14 @@ class Asset(BaseModel):
     classification: Classification
 
 
+class SeriesArrays(BaseModel):
+    t: List[int] = Field(..., description="Unix timestamps")
+    v: List[float] = Field(..., description="Values, parallel to t")
+
 class TimeseriesResponse(BaseModel):
     asset_id: str
-    data: List[Dict[str, Dict[str, float]]]
+    # Parallel arrays per measurement, or the legacy timestamp -> value map
+    data: List[Dict[str, Union[SeriesArrays, Dict[str, float]]]]
 
 class LastValueResponse(BaseModel):
     asset_id: str
@@ -63,38 +85,76 @@ HUMIDITY_RANGE = (20, 80)  # %
 SPEED_RANGE = (0, 3000)  # RPM
 TORQUE_RANGE = (0, 200)  # Nm
 
+# Series channels in kernel order, with their value ranges, uniform noise
+# ranges and occasional jumps (probability, low, high)
+CHANNELS = ("flow", "pressure", "vibration", "energy_consumption", "temperature", "humidity", "speed", "torque")
+CHANNEL_RANGES = np.array([
+    FLOW_RANGE, PRESSURE_RANGE, VIBRATION_RANGE, ENERGY_RANGE,
+    TEMPERATURE_RANGE, HUMIDITY_RANGE, SPEED_RANGE, TORQUE_RANGE
+], dtype=np.float64)
+NOISE_RANGES = {
+    "flow": (-10, 10),
+    "pressure": (-5, 5),
+    "vibration": (-1, 1),
+    "energy_consumption": (-50, 50),
+    "temperature": (-2, 2),
+    "humidity": (-5, 5),
+    "speed": (-100, 100),
+    "torque": (-10, 10)
+}
+JUMPS = {
+    "vibration": (0.05, 2, 4),  # 5% chance of spike
+    "speed": (0.1, -300, 300)  # 10% chance of significant change
+}
+
 # Measurement availability by classification
-CLASSIFICATION_MEASUREMENTS = {
+CLASSIFICATION_MEASUREMENTS = {k: frozenset(v) for k, v in {
     "mechanical": ["flow", "pressure", "vibration", "speed", "torque"],
     "electrical": ["energy_consumption", "temperature"],
     "equipment": ["flow", "pressure", "vibration", "energy_consumption", "speed", "torque"],
     "sensor": ["temperature", "humidity", "pressure", "flow"],
     "hvac": ["temperature", "humidity", "flow", "energy_consumption"]
-}
+}.items()}
+
+# Seed for the assets and all generated data. Every worker of one server must
+# use the same value (start_server.py sets it before starting them)
+DATA_SEED = int(os.environ.get("DATA_SEED") or random.randrange(1 << 32))
 
 # Time configuration
 INTERVAL_MINUTES = 5
 MONTHS_SPAN = 3
 
-def generate_alphanumeric_key(length=8):
+# Daily and weekly cycles sampled on the interval grid; the generator indexes
+# these instead of evaluating sin per point
+TICKS_PER_DAY = 24 * 60 // INTERVAL_MINUTES
+SIN_DAILY = np.sin(np.arange(TICKS_PER_DAY) * 2 * np.pi / TICKS_PER_DAY)
+SIN_WEEKLY = np.sin(np.arange(TICKS_PER_DAY * 7) * 2 * np.pi / (TICKS_PER_DAY * 7))
+
+# Per-thread scratch space for the generator, sized for the default range
+MAX_TICKS = MONTHS_SPAN * 30 * TICKS_PER_DAY + 1
+SCRATCH_ROWS = 2 * len(CHANNELS) + 2
+_SCRATCH = threading.local()
+
+def generate_alphanumeric_key(length=8, rng=random):
     """Generate a random alphanumeric key"""
     characters = string.ascii_uppercase + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    return ''.join(rng.choice(characters) for _ in range(length))
 
 def generate_assets() -> List[Asset]:
     """Generate mock asset data"""
     assets = []
+    rng = random.Random(DATA_SEED)
     
     # Generate sensor assets
     for i in range(1, ASSET_COUNT + 1):
-        sensor_type = random.choice(SENSOR_TYPES)
-        classification = random.choice(CLASSIFICATIONS)
+        sensor_type = rng.choice(SENSOR_TYPES)
+        classification = rng.choice(CLASSIFICATIONS)
         
         asset = Asset(
             id=i,
-            key=generate_alphanumeric_key(),
+            key=generate_alphanumeric_key(rng=rng),
             name=f"{sensor_type.capitalize()} Sensor {i}",
-            location=f"{random.choice(BUILDINGS)} {random.choice(FLOORS)}",
+            location=f"{rng.choice(BUILDINGS)} {rng.choice(FLOORS)}",
             classification=classification
         )
         assets.append(asset)
@@ -103,176 +163,382 @@ def generate_assets() -> List[Asset]:
 
 def get_asset_by_key(asset_key: str) -> Optional[Asset]:
     """Get asset by its key"""
-    for asset in ASSETS:
-        if asset.key == asset_key:
-            return asset
-    return None
+    return ASSETS_BY_KEY.get(asset_key)
+
+def _rng_for(asset_key: str, *extra: Any) -> np.random.Generator:
+    """
+    Private PCG64 generator seeded by the asset key (and any extra values), so
+    data is reproducible per asset and concurrent requests never share state
+    """
+    return np.random.default_rng(_stable_hash(asset_key, *extra))
+
+def _stable_hash(*parts: Any) -> int:
+    """
+    64-bit hash of DATA_SEED and parts; unlike hash() it is the same in every
+    process, so all workers generate identical data
+    """
+    digest = hashlib.blake2b(repr((DATA_SEED, *parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
 
 def generate_timeseries_data(
     asset_key: str, 
     start_timestamp: int, 
     end_timestamp: int,
-    measurements: Optional[List[str]] = None
-) -> List[Dict[str, Dict[str, float]]]:
-    """Generate mock timeseries data for an asset within the specified time range"""
-    # Get the asset to determine its classification
-    asset = get_asset_by_key(asset_key)
-    if not asset:
+    measurements: Optional[List[str]] = None,
+    response_format: str = "arrays"
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Generate mock timeseries data for an asset within the specified time range
+
+    Each measurement is {"t": [timestamps], "v": [values]}, or with
+    response_format="map" the legacy {"<timestamp>": value} mapping
+    """
+    if asset_key not in ASSET_MEASUREMENTS:
         return []
         
-    # Determine which measurements to include based on classification
-    available_measurements = CLASSIFICATION_MEASUREMENTS.get(asset.classification, [])
+    # Measurements available for the asset's classification
+    available_measurements = ASSET_MEASUREMENTS[asset_key]
+    generate = _generate_series
     
-    # Filter by requested measurements if provided
+    # Filter by requested measurements if provided; such one-off subsets
+    # bypass the cache so they don't evict the full-asset entries
     if measurements:
-        available_measurements = [m for m in available_measurements if m in measurements]
+        requested = frozenset(measurements)
+        available_measurements = tuple(m for m in available_measurements if m in requested)
+        generate = _generate_series.__wrapped__
     
     # If no measurements are available or requested, return empty data
     if not available_measurements:
         return []
     
-    # Set random seed based on asset_key for consistent data per asset
-    random.seed(hash(asset_key))
+    timestamps, values = generate(
+        asset_key, start_timestamp, end_timestamp, available_measurements
+    )
+    if not timestamps.size:
+        return []
     
-    # Generate base values for this asset (each asset has different characteristics)
-    base_values = {
-        "flow": random.uniform(FLOW_RANGE[0] + 20, FLOW_RANGE[1] - 20) if "flow" in available_measurements else None,
-        "pressure": random.uniform(PRESSURE_RANGE[0] + 10, PRESSURE_RANGE[1] - 10) if "pressure" in available_measurements else None,
-        "vibration": random.uniform(VIBRATION_RANGE[0] + 1, VIBRATION_RANGE[1] - 2) if "vibration" in available_measurements else None,
-        "energy_consumption": random.uniform(ENERGY_RANGE[0] + 100, ENERGY_RANGE[1] - 200) if "energy_consumption" in available_measurements else None,
-        "temperature": random.uniform(TEMPERATURE_RANGE[0] + 5, TEMPERATURE_RANGE[1] - 5) if "temperature" in available_measurements else None,
-        "humidity": random.uniform(HUMIDITY_RANGE[0] + 10, HUMIDITY_RANGE[1] - 10) if "humidity" in available_measurements else None,
-        "speed": random.uniform(SPEED_RANGE[0] + 500, SPEED_RANGE[1] - 500) if "speed" in available_measurements else None,
-        "torque": random.uniform(TORQUE_RANGE[0] + 50, TORQUE_RANGE[1] - 50) if "torque" in available_measurements else None
-    }
+    # Convert to the required format: list of dicts, each containing one measurement type.
+    # Lists are built here, per response, so the cache only holds compact arrays
+    timestamps = timestamps.tolist()
+    series = zip(available_measurements, values.tolist())
+    if response_format == "map":
+        # One key string per tick, shared by every measurement's map
+        keys = list(map(str, timestamps))
+        return [{measurement: dict(zip(keys, row))} for measurement, row in series]
+    return [{measurement: {"t": timestamps, "v": row}} for measurement, row in series]
+
+def _fill_series_numpy(out, enabled, base, noise, sin_daily, sin_weekly, ranges):
+    """Compute every channel of a series from pre-drawn noise into out"""
+    n = noise.shape[1]
+    ticks = np.arange(n)
+    daily = np.take(sin_daily, ticks, mode='wrap')
+    np.add(base[:, np.newaxis], noise, out=out)
     
-    # Collect all data points first
-    all_data_points = {}
-    for measurement in available_measurements:
-        all_data_points[measurement] = {}
+    def finish(channel):
+        np.round(np.clip(out[channel], *ranges[channel], out=out[channel]), 2, out=out[channel])
     
-    current_timestamp = start_timestamp
+    # Flow with weekly cycle; pressure correlated with flow
+    out[0] += 15 * np.take(sin_weekly, ticks, mode='wrap')
+    finish(0)
+    if enabled[0]:
+        out[1] += (out[0] - base[0]) * 0.3
+    # Energy consumption and temperature with daily pattern
+    out[3] += 200 * daily
+    out[4] += 5 * daily
+    for channel in (1, 2, 3, 4, 6):
+        finish(channel)
+    # Humidity inversely correlated with temperature, torque with speed
+    if enabled[4]:
+        out[5] -= (out[4] - base[4]) * 2
+    if enabled[6]:
+        out[7] += (out[6] - base[6]) * 0.05
+    finish(5)
+    finish(7)
+    return out
+
+if njit is not None:
+    @njit(cache=True)
+    def _clip_round(value, low, high):
+        return np.rint(min(max(value, low), high) * 100.0) / 100.0
+
+    @njit(cache=True, fastmath=True)
+    def _fill_series(out, enabled, base, noise, sin_daily, sin_weekly, ranges):
+        """Fused single-pass version of _fill_series_numpy"""
+        n = noise.shape[1]
+        for i in range(n):
+            daily = sin_daily[i % sin_daily.size]
+            weekly = sin_weekly[i % sin_weekly.size]
+            out[0, i] = _clip_round(base[0] + 15.0 * weekly + noise[0, i], ranges[0, 0], ranges[0, 1])
+            pressure = base[1] + noise[1, i]
+            if enabled[0]:
+                pressure += (out[0, i] - base[0]) * 0.3
+            out[1, i] = _clip_round(pressure, ranges[1, 0], ranges[1, 1])
+            out[2, i] = _clip_round(base[2] + noise[2, i], ranges[2, 0], ranges[2, 1])
+            out[3, i] = _clip_round(base[3] + 200.0 * daily + noise[3, i], ranges[3, 0], ranges[3, 1])
+            out[4, i] = _clip_round(base[4] + 5.0 * daily + noise[4, i], ranges[4, 0], ranges[4, 1])
+            humidity = base[5] + noise[5, i]
+            if enabled[4]:
+                humidity -= (out[4, i] - base[4]) * 2.0
+            out[5, i] = _clip_round(humidity, ranges[5, 0], ranges[5, 1])
+            out[6, i] = _clip_round(base[6] + noise[6, i], ranges[6, 0], ranges[6, 1])
+            torque = base[7] + noise[7, i]
+            if enabled[6]:
+                torque += (out[6, i] - base[6]) * 0.05
+            out[7, i] = _clip_round(torque, ranges[7, 0], ranges[7, 1])
+        return out
+
+    # Compile (or load from cache) at startup rather than on the first request
+    _fill_series(
+        np.empty((len(CHANNELS), 1)), np.ones(len(CHANNELS), dtype=np.bool_),
+        np.zeros(len(CHANNELS)), np.zeros((len(CHANNELS), 1)),
+        SIN_DAILY, SIN_WEEKLY, CHANNEL_RANGES
+    )
+else:
+    _fill_series = None
+
+def _scratch(n: int) -> np.ndarray:
+    """This thread's float64 work buffer, viewed as SCRATCH_ROWS contiguous rows of n"""
+    buffer = getattr(_SCRATCH, "buffer", None)
+    if buffer is None or buffer.size < SCRATCH_ROWS * n:
+        buffer = _SCRATCH.buffer = np.empty(SCRATCH_ROWS * max(n, MAX_TICKS))
+    return buffer[:SCRATCH_ROWS * n].reshape(SCRATCH_ROWS, n)
+
+def _uniform(rng: np.random.Generator, low: float, high: float, out: np.ndarray) -> None:
+    """rng.uniform(low, high) into out (same draws, no allocation)"""
+    rng.random(out=out)
+    out *= high - low
+    out += low
+
+@functools.lru_cache(maxsize=32)
+def _generate_series(
+    asset_key: str,
+    start_timestamp: int,
+    end_timestamp: int,
+    available_measurements: Tuple[str, ...]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the series for an asset as read-only arrays: the int64 timestamps
+    and a float64 row of values per measurement, in available_measurements order
+
+    Generation is deterministic per asset key, so results are cached; compact
+    arrays rather than Python lists keep each worker's cache small
+    """
+    base_values = ASSET_BASE_VALUES[asset_key]
     
-    while current_timestamp <= end_timestamp:
-        # Add some realistic variation using sine waves and random noise
-        time_factor = (current_timestamp - start_timestamp) / (24 * 3600)  # Days since start
-        
-        # Flow with daily cycle and random variation
-        if "flow" in available_measurements:
-            flow = base_values["flow"] + 15 * math.sin(time_factor * 2 * math.pi / 7) + random.uniform(-10, 10)
-            flow = max(FLOW_RANGE[0], min(FLOW_RANGE[1], flow))
-            all_data_points["flow"][str(current_timestamp)] = round(flow, 2)
-        
-        # Pressure with some correlation to flow
-        if "pressure" in available_measurements:
-            if "flow" in available_measurements:
-                flow_val = all_data_points["flow"][str(current_timestamp)]
-                pressure = base_values["pressure"] + (flow_val - base_values["flow"]) * 0.3 + random.uniform(-5, 5)
-            else:
-                pressure = base_values["pressure"] + random.uniform(-5, 5)
-            pressure = max(PRESSURE_RANGE[0], min(PRESSURE_RANGE[1], pressure))
-            all_data_points["pressure"][str(current_timestamp)] = round(pressure, 2)
-        
-        # Vibration with occasional spikes
-        if "vibration" in available_measurements:
-            vibration = base_values["vibration"] + random.uniform(-1, 1)
-            if random.random() < 0.05:  # 5% chance of spike
-                vibration += random.uniform(2, 4)
-            vibration = max(VIBRATION_RANGE[0], min(VIBRATION_RANGE[1], vibration))
-            all_data_points["vibration"][str(current_timestamp)] = round(vibration, 2)
-        
-        # Energy consumption with daily pattern
-        if "energy_consumption" in available_measurements:
-            energy = base_values["energy_consumption"] + 200 * math.sin(time_factor * 2 * math.pi) + random.uniform(-50, 50)
-            energy = max(ENERGY_RANGE[0], min(ENERGY_RANGE[1], energy))
-            all_data_points["energy_consumption"][str(current_timestamp)] = round(energy, 2)
-            
-        # Temperature with daily pattern
-        if "temperature" in available_measurements:
-            temp = base_values["temperature"] + 5 * math.sin(time_factor * 2 * math.pi) + random.uniform(-2, 2)
-            temp = max(TEMPERATURE_RANGE[0], min(TEMPERATURE_RANGE[1], temp))
-            all_data_points["temperature"][str(current_timestamp)] = round(temp, 2)
-            
-        # Humidity with inverse correlation to temperature
-        if "humidity" in available_measurements:
-            if "temperature" in available_measurements:
-                temp_val = all_data_points["temperature"][str(current_timestamp)]
-                humidity = base_values["humidity"] - (temp_val - base_values["temperature"]) * 2 + random.uniform(-5, 5)
-            else:
-                humidity = base_values["humidity"] + random.uniform(-5, 5)
-            humidity = max(HUMIDITY_RANGE[0], min(HUMIDITY_RANGE[1], humidity))
-            all_data_points["humidity"][str(current_timestamp)] = round(humidity, 2)
-            
-        # Speed with occasional variations
-        if "speed" in available_measurements:
-            speed = base_values["speed"] + random.uniform(-100, 100)
-            if random.random() < 0.1:  # 10% chance of significant change
-                speed += random.uniform(-300, 300)
-            speed = max(SPEED_RANGE[0], min(SPEED_RANGE[1], speed))
-            all_data_points["speed"][str(current_timestamp)] = round(speed, 2)
-            
-        # Torque with correlation to speed
-        if "torque" in available_measurements:
-            if "speed" in available_measurements:
-                speed_val = all_data_points["speed"][str(current_timestamp)]
-                torque = base_values["torque"] + (speed_val - base_values["speed"]) * 0.05 + random.uniform(-10, 10)
-            else:
-                torque = base_values["torque"] + random.uniform(-10, 10)
-            torque = max(TORQUE_RANGE[0], min(TORQUE_RANGE[1], torque))
-            all_data_points["torque"][str(current_timestamp)] = round(torque, 2)
-        
-        # Move to next interval (5 minutes)
-        current_timestamp += INTERVAL_MINUTES * 60
+    # Whole timestamp axis at once; each measurement is one array over it
+    timestamps = np.arange(
+        start_timestamp, end_timestamp + 1, INTERVAL_MINUTES * 60, dtype=np.int64
+    )
+    n = timestamps.size
+    if n == 0:
+        return timestamps, np.empty((0, 0))
+    rng = _rng_for(asset_key, start_timestamp)
+    enabled = np.array([m in available_measurements for m in CHANNELS])
+    base = np.array([base_values[m] if base_values[m] is not None else 0.0 for m in CHANNELS])
     
-    # Convert to the required format: list of dicts, each containing one measurement type
-    result = []
-    for measurement in available_measurements:
-        if all_data_points[measurement]:
-            result.append({measurement: all_data_points[measurement]})
+    # Reused per-thread buffers: noise and output rows per channel plus two
+    # rows for the jump draws
+    work = _scratch(n)
+    noise, out = work[:len(CHANNELS)], work[len(CHANNELS):2 * len(CHANNELS)]
+    jump_chance, jump = work[-2], work[-1]
     
-    return result
+    # Draw all random variation up front, in place: uniform noise per channel
+    # plus the occasional vibration spikes and speed changes
+    for channel, measurement in enumerate(CHANNELS):
+        row = noise[channel]
+        if not enabled[channel]:
+            row.fill(0.0)
+            continue
+        low, high = NOISE_RANGES[measurement]
+        _uniform(rng, low, high, row)
+        if measurement in JUMPS:
+            probability, low, high = JUMPS[measurement]
+            rng.random(out=jump_chance)
+            _uniform(rng, low, high, jump)
+            np.putmask(jump, jump_chance >= probability, 0.0)
+            row += jump
+    
+    fill = _fill_series if _fill_series is not None else _fill_series_numpy
+    fill(out, enabled, base, noise, SIN_DAILY, SIN_WEEKLY, CHANNEL_RANGES)
+    
+    # Fancy indexing copies the rows out of the reused scratch buffer
+    values = out[[CHANNELS.index(m) for m in available_measurements]]
+    timestamps.setflags(write=False)
+    values.setflags(write=False)
+    return timestamps, values
 
 def get_default_time_range():
     """Get default start and end timestamps for 3 months of data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=MONTHS_SPAN * 30)  # Approximate 3 months
-    return int(start_time.timestamp()), int(end_time.timestamp())
+    # Align to the sampling interval so requests within the same interval
+    # share a cache entry
+    end_time = _align_to_interval(int(datetime.now().timestamp()))
+    start_time = end_time - int(timedelta(days=MONTHS_SPAN * 30).total_seconds())  # Approximate 3 months
+    return start_time, end_time
+
+def _align_to_interval(timestamp: int) -> int:
+    """Round a Unix timestamp down to the start of its sampling interval"""
+    return timestamp - timestamp % (INTERVAL_MINUTES * 60)
+
+@functools.lru_cache(maxsize=64)
+def _generate_last_values(
+    asset_key: str,
+    current_timestamp: int,
+    available_measurements: Tuple[str, ...]
+) -> Tuple[Tuple[str, float], ...]:
+    """Compute the (measurement, value) pairs for an asset at a timestamp"""
+    base_values = ASSET_BASE_VALUES[asset_key]
+    # A handful of scalar draws: random.Random is much cheaper to seed and
+    # call per value than a numpy Generator, and still private to this call
+    rng = random.Random(_stable_hash(asset_key, current_timestamp // (INTERVAL_MINUTES * 60)))
+    
+    # Generate current values with some variation
+    current_values = {}
+    daily_phase = current_timestamp / (24 * 3600) * 2 * math.pi  # Days since the epoch, in radians
+    
+    for measurement in available_measurements:
+        if measurement == "flow":
+            value = base_values["flow"] + 15 * math.sin(daily_phase / 7) + rng.uniform(-10, 10)
+            value = max(FLOW_RANGE[0], min(FLOW_RANGE[1], value))
+        elif measurement == "pressure":
+            value = base_values["pressure"] + rng.uniform(-5, 5)
+            value = max(PRESSURE_RANGE[0], min(PRESSURE_RANGE[1], value))
+        elif measurement == "vibration":
+            value = base_values["vibration"] + rng.uniform(-1, 1)
+            if rng.random() < 0.05:  # 5% chance of spike
+                value += rng.uniform(2, 4)
+            value = max(VIBRATION_RANGE[0], min(VIBRATION_RANGE[1], value))
+        elif measurement == "energy_consumption":
+            value = base_values["energy_consumption"] + 200 * math.sin(daily_phase) + rng.uniform(-50, 50)
+            value = max(ENERGY_RANGE[0], min(ENERGY_RANGE[1], value))
+        elif measurement == "temperature":
+            value = base_values["temperature"] + 5 * math.sin(daily_phase) + rng.uniform(-2, 2)
+            value = max(TEMPERATURE_RANGE[0], min(TEMPERATURE_RANGE[1], value))
+        elif measurement == "humidity":
+            if "temperature" in current_values:
+                value = base_values["humidity"] - (current_values["temperature"] - base_values["temperature"]) * 2 + rng.uniform(-5, 5)
+            else:
+                value = base_values["humidity"] + rng.uniform(-5, 5)
+            value = max(HUMIDITY_RANGE[0], min(HUMIDITY_RANGE[1], value))
+        elif measurement == "speed":
+            value = base_values["speed"] + rng.uniform(-100, 100)
+            if rng.random() < 0.1:  # 10% chance of significant change
+                value += rng.uniform(-300, 300)
+            value = max(SPEED_RANGE[0], min(SPEED_RANGE[1], value))
+        elif measurement == "torque":
+            if "speed" in current_values:
+                value = base_values["torque"] + (current_values["speed"] - base_values["speed"]) * 0.05 + rng.uniform(-10, 10)
+            else:
+                value = base_values["torque"] + rng.uniform(-10, 10)
+            value = max(TORQUE_RANGE[0], min(TORQUE_RANGE[1], value))
+        else:
+            value = 0.0
+        
+        current_values[measurement] = round(value, 2)
+    
+    return tuple(current_values.items())
+
+def _draw_base_values(asset_key: str, available_measurements: Tuple[str, ...]) -> Dict[str, Optional[float]]:
+    """Draw the base values for an asset (each asset has different characteristics)"""
+    rng = _rng_for(asset_key)
+    return {
+        "flow": rng.uniform(FLOW_RANGE[0] + 20, FLOW_RANGE[1] - 20) if "flow" in available_measurements else None,
+        "pressure": rng.uniform(PRESSURE_RANGE[0] + 10, PRESSURE_RANGE[1] - 10) if "pressure" in available_measurements else None,
+        "vibration": rng.uniform(VIBRATION_RANGE[0] + 1, VIBRATION_RANGE[1] - 2) if "vibration" in available_measurements else None,
+        "energy_consumption": rng.uniform(ENERGY_RANGE[0] + 100, ENERGY_RANGE[1] - 200) if "energy_consumption" in available_measurements else None,
+        "temperature": rng.uniform(TEMPERATURE_RANGE[0] + 5, TEMPERATURE_RANGE[1] - 5) if "temperature" in available_measurements else None,
+        "humidity": rng.uniform(HUMIDITY_RANGE[0] + 10, HUMIDITY_RANGE[1] - 10) if "humidity" in available_measurements else None,
+        "speed": rng.uniform(SPEED_RANGE[0] + 500, SPEED_RANGE[1] - 500) if "speed" in available_measurements else None,
+        "torque": rng.uniform(TORQUE_RANGE[0] + 50, TORQUE_RANGE[1] - 50) if "torque" in available_measurements else None
+    }
 
 # Generate assets once at startup
 ASSETS = generate_assets()
+ASSETS_BY_KEY: Dict[str, Asset] = {asset.key: asset for asset in ASSETS}
+# Available measurements per asset, in canonical CHANNELS order so outputs
+# are deterministic and the tuples can key the generator caches directly
+ASSET_MEASUREMENTS: Dict[str, Tuple[str, ...]] = {
+    asset.key: tuple(
+        m for m in CHANNELS if m in CLASSIFICATION_MEASUREMENTS.get(asset.classification, frozenset())
+    )
+    for asset in ASSETS
+}
+ASSET_BASE_VALUES: Dict[str, Dict[str, Optional[float]]] = {
+    key: _draw_base_values(key, measurements) for key, measurements in ASSET_MEASUREMENTS.items()
+}
+
+@functools.lru_cache(maxsize=1)
+def _available_asset_keys() -> str:
+    """Asset key listing for 404 messages, built on first use"""
+    return str(list(ASSETS_BY_KEY))
+
+def _asset_not_found(asset_key: str) -> HTTPException:
+    """404 error for an unknown asset key"""
+    return HTTPException(
+        status_code=404, 
+        detail=f"Asset with key {asset_key} not found. Available asset keys: {_available_asset_keys()}"
+    )
+
+def _timeseries_etag(asset_key: str, start_date: int, end_date: int, response_format: str) -> str:
+    """
+    Weak ETag for a /timeseries response: GZipMiddleware serves the same
+    representation gzip-encoded or as identity, so the bytes differ per encoding
+    """
+    # Assets and series are derived from DATA_SEED, so it is part of the tag
+    key = f"{DATA_SEED}:{asset_key}:{start_date}:{end_date}:{response_format}"
+    return 'W/"' + hashlib.blake2b(key.encode(), digest_size=8).hexdigest() + '"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check using weak comparison (the W/ prefix is ignored)"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") in (opaque, "*")
+        for tag in if_none_match.split(",")
+    )
+
+# Static responses, serialized once at startup
+ROOT_JSON_BYTES = orjson.dumps({
+    "message": "Asset Data Server",
+    "endpoints": {
+        "scan": "/scan - Get list of available assets",
+        "timeseries": "/timeseries - Get timeseries data for an asset",
+        "lastvalue": "/lastvalue - Get the most recent data point for an asset"
+    }
+})
+SCAN_JSON_BYTES = orjson.dumps([asset.model_dump(mode="json") for asset in ASSETS])
 
 @app.get("/")
 async def root():
-    return {
-        "message": "Asset Data Server",
-        "endpoints": {
-            "scan": "/scan - Get list of available assets",
-            "timeseries": "/timeseries - Get timeseries data for an asset",
-            "lastvalue": "/lastvalue - Get the most recent data point for an asset"
-        }
-    }
+    return Response(content=ROOT_JSON_BYTES, media_type="application/json")
 
-@app.get("/scan", response_model=List[Asset])
+@app.get("/scan", responses={200: {"model": List[Asset]}})
 async def get_assets():
     """Get list of all available assets"""
-    return ASSETS
+    return Response(content=SCAN_JSON_BYTES, media_type="application/json")
 
-@app.get("/timeseries", response_model=TimeseriesResponse)
-async def get_timeseries(
+# The generator's output is trusted, so the response is serialized directly
+# instead of being revalidated against TimeseriesResponse (kept for the docs).
+# Plain def: FastAPI runs it in its threadpool, so generating a long series
+# doesn't block the event loop for other requests
+@app.get("/timeseries", responses={200: {"model": TimeseriesResponse}})
+def get_timeseries(
+    request: Request,
     asset_key: str = Query(..., description="Asset key to get data for"),
     start_date: Optional[int] = Query(None, description="Start timestamp (Unix)"),
     end_date: Optional[int] = Query(None, description="End timestamp (Unix)"),
-    time_interval: Optional[int] = Query(5, description="Time interval in minutes (currently only 5 min supported)")
+    time_interval: Optional[int] = Query(5, description="Time interval in minutes (currently only 5 min supported)"),
+    response_format: Literal["arrays", "map"] = Query(
+        "arrays",
+        alias="format",
+        description="'arrays' for parallel t/v lists per measurement; 'map' for the legacy timestamp -> value object"
+    )
 ):
     """Get timeseries data for a specific asset"""
     
     # Validate asset exists
-    asset_keys = [asset.key for asset in ASSETS]
-    if asset_key not in asset_keys:
-        raise HTTPException(
-            status_code=404, 
-            detail=f"Asset with key {asset_key} not found. Available asset keys: {asset_keys}"
-        )
+    if asset_key not in ASSETS_BY_KEY:
+        raise _asset_not_found(asset_key)
     
     # Validate time interval
     if time_interval != 5:
@@ -294,31 +560,41 @@ async def get_timeseries(
             detail="start_date must be before end_date"
         )
     
-    # Generate timeseries data
-    data_points = generate_timeseries_data(asset_key, start_date, end_date)
+    # The series is deterministic in these parameters, so clients holding the
+    # current version can skip the body entirely
+    etag = _timeseries_etag(asset_key, start_date, end_date, response_format)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=300",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=304, headers=cache_headers)
     
-    return TimeseriesResponse(
-        asset_id=asset_key,
-        data=data_points
+    # Generate timeseries data
+    data_points = generate_timeseries_data(
+        asset_key, start_date, end_date, response_format=response_format
     )
+    
+    return ORJSONResponse({
+        "asset_id": asset_key,
+        "data": data_points
+    }, headers=cache_headers)
 
-@app.get("/lastvalue", response_model=LastValueResponse)
+# Like /timeseries: LastValueResponse only documents the schema, the trusted
+# values are serialized directly without response-model validation
+@app.get("/lastvalue", responses={200: {"model": LastValueResponse}})
 async def get_last_value(
     asset_key: str = Query(..., description="Asset key to get the latest value for")
 ):
     """Get the most recent data point for a specific asset"""
     
     # Validate asset exists
-    asset_keys = [asset.key for asset in ASSETS]
-    if asset_key not in asset_keys:
-        raise HTTPException(
-            status_code=404, 
-            detail=f"Asset with key {asset_key} not found. Available asset keys: {asset_keys}"
-        )
+    if asset_key not in ASSETS_BY_KEY:
+        raise _asset_not_found(asset_key)
     
-    # Get the asset to determine its classification and available measurements
-    asset = get_asset_by_key(asset_key)
-    available_measurements = CLASSIFICATION_MEASUREMENTS.get(asset.classification, [])
+    # Measurements available for the asset's classification
+    available_measurements = ASSET_MEASUREMENTS[asset_key]
     
     if not available_measurements:
         raise HTTPException(
@@ -326,73 +602,19 @@ async def get_last_value(
             detail=f"No measurements available for asset {asset_key}"
         )
     
-    # Generate current timestamp (now)
-    current_timestamp = int(time.time())
-    
-    # Set random seed based on asset_key for consistent data per asset
-    random.seed(hash(asset_key))
+    # Latest sample time (now, aligned to the sampling interval so bursts of
+    # requests within one interval share a cached result)
+    current_timestamp = _align_to_interval(int(time.time()))
     
-    # Generate base values for this asset (same as timeseries)
-    base_values = {
-        "flow": random.uniform(FLOW_RANGE[0] + 20, FLOW_RANGE[1] - 20) if "flow" in available_measurements else None,
-        "pressure": random.uniform(PRESSURE_RANGE[0] + 10, PRESSURE_RANGE[1] - 10) if "pressure" in available_measurements else None,
-        "vibration": random.uniform(VIBRATION_RANGE[0] + 1, VIBRATION_RANGE[1] - 2) if "vibration" in available_measurements else None,
-        "energy_consumption": random.uniform(ENERGY_RANGE[0] + 100, ENERGY_RANGE[1] - 200) if "energy_consumption" in available_measurements else None,
-        "temperature": random.uniform(TEMPERATURE_RANGE[0] + 5, TEMPERATURE_RANGE[1] - 5) if "temperature" in available_measurements else None,
-        "humidity": random.uniform(HUMIDITY_RANGE[0] + 10, HUMIDITY_RANGE[1] - 10) if "humidity" in available_measurements else None,
-        "speed": random.uniform(SPEED_RANGE[0] + 500, SPEED_RANGE[1] - 500) if "speed" in available_measurements else None,
-        "torque": random.uniform(TORQUE_RANGE[0] + 50, TORQUE_RANGE[1] - 50) if "torque" in available_measurements else None
-    }
-    
-    # Generate current values with some variation
-    current_values = {}
-    time_factor = current_timestamp / (24 * 3600)  # Current time factor
-    
-    for measurement in available_measurements:
-        if measurement == "flow":
-            value = base_values["flow"] + 15 * math.sin(time_factor * 2 * math.pi / 7) + random.uniform(-10, 10)
-            value = max(FLOW_RANGE[0], min(FLOW_RANGE[1], value))
-        elif measurement == "pressure":
-            value = base_values["pressure"] + random.uniform(-5, 5)
-            value = max(PRESSURE_RANGE[0], min(PRESSURE_RANGE[1], value))
-        elif measurement == "vibration":
-            value = base_values["vibration"] + random.uniform(-1, 1)
-            if random.random() < 0.05:  # 5% chance of spike
-                value += random.uniform(2, 4)
-            value = max(VIBRATION_RANGE[0], min(VIBRATION_RANGE[1], value))
-        elif measurement == "energy_consumption":
-            value = base_values["energy_consumption"] + 200 * math.sin(time_factor * 2 * math.pi) + random.uniform(-50, 50)
-            value = max(ENERGY_RANGE[0], min(ENERGY_RANGE[1], value))
-        elif measurement == "temperature":
-            value = base_values["temperature"] + 5 * math.sin(time_factor * 2 * math.pi) + random.uniform(-2, 2)
-            value = max(TEMPERATURE_RANGE[0], min(TEMPERATURE_RANGE[1], value))
-        elif measurement == "humidity":
-            if "temperature" in current_values:
-                value = base_values["humidity"] - (current_values["temperature"] - base_values["temperature"]) * 2 + random.uniform(-5, 5)
-            else:
-                value = base_values["humidity"] + random.uniform(-5, 5)
-            value = max(HUMIDITY_RANGE[0], min(HUMIDITY_RANGE[1], value))
-        elif measurement == "speed":
-            value = base_values["speed"] + random.uniform(-100, 100)
-            if random.random() < 0.1:  # 10% chance of significant change
-                value += random.uniform(-300, 300)
-            value = max(SPEED_RANGE[0], min(SPEED_RANGE[1], value))
-        elif measurement == "torque":
-            if "speed" in current_values:
-                value = base_values["torque"] + (current_values["speed"] - base_values["speed"]) * 0.05 + random.uniform(-10, 10)
-            else:
-                value = base_values["torque"] + random.uniform(-10, 10)
-            value = max(TORQUE_RANGE[0], min(TORQUE_RANGE[1], value))
-        else:
-            value = 0.0
-        
-        current_values[measurement] = round(value, 2)
-    
-    return LastValueResponse(
-        asset_id=asset_key,
-        data=current_values,
-        timestamp=current_timestamp
+    current_values = dict(
+        _generate_last_values(asset_key, current_timestamp, available_measurements)
     )
+    
+    return ORJSONResponse({
+        "asset_id": asset_key,
+        "data": current_values,
+        "timestamp": current_timestamp
+    })
 
 if __name__ == "__main__":
     import uvicorn
@@ -3,10 +3,27 @@
 Startup script for the Asset Data Server
 """
 
+import importlib.util
+import os
+import random
+
 import uvicorn
-from main import app
 
 if __name__ == "__main__":
+    # Workers are separate processes; a shared seed makes them all serve the
+    # same assets and data
+    os.environ.setdefault("DATA_SEED", str(random.randrange(1 << 32)))
+    # Opt-in tuning for production: WORKERS=auto (one per CPU) or a count,
+    # LOG_LEVEL=warning and ACCESS_LOG=0 for quieter, faster logging
+    workers_env = os.environ.get("WORKERS", "1")
+    workers = (os.cpu_count() or 1) if workers_env == "auto" else int(workers_env)
+    log_level = os.environ.get("LOG_LEVEL", "info")
+    access_log = os.environ.get("ACCESS_LOG", "1").lower() in ("1", "true", "yes")
+
+    # uvloop/httptools come with uvicorn[standard] (uvloop is not on Windows)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    http = "httptools" if importlib.util.find_spec("httptools") else "auto"
+
     print("🚀 Starting Asset Data Server...")
     print(
         "📊 Server will provide data for 15 assets with 3 months of 5-minute interval data"
@@ -19,4 +36,14 @@ if __name__ == "__main__":
     print("  GET /timeseries?asset_key=<ASSET_KEY> - Get timeseries data")
     print("\nPress Ctrl+C to stop the server\n")
 
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", access_log=True)
+    # Multiple workers need the app as an import string
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop=loop,
+        http=http,
+        log_level=log_level,
+        access_log=access_log,
+    )
@@ -5,11 +5,13 @@
 # Displaying agent responses
 # Managing conversation state
 
+import uuid
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass
-from agents.agent_factory import get_chat_agent
+from agents.agent_factory import get_agent_pool
+from agents.event_loop import iterate
 
 
 @dataclass
@@ -48,23 +50,19 @@ def display_chat_messages() -> None:
             with st.chat_message(message["role"]):
                 # Display the text content
                 st.markdown(message["content"])
+                display_message_attachments(message)
 
-                # Display visualizations if present (only for assistant messages)
-                if (
-                    message["role"] == "assistant"
-                    and "visualizations" in message
-                    and message["visualizations"]
-                ):
-                    for viz in message["visualizations"]:
-                        st.plotly_chart(viz, use_container_width=True)
 
-                # Display data tables if present (only for assistant messages)
-                if (
-                    message["role"] == "assistant"
-                    and "data" in message
-                    and message["data"] is not None
-                ):
-                    st.dataframe(message["data"], use_container_width=True)
+def display_message_attachments(message: Dict[str, Any]) -> None:
+    """Render an assistant message's visualizations and data table, if any"""
+    if message["role"] != "assistant":
+        return
+
+    for viz in message.get("visualizations") or []:
+        st.plotly_chart(viz, use_container_width=True)
+
+    if message.get("data") is not None:
+        st.dataframe(message["data"], use_container_width=True)
 
 
 def initialize_chat_state() -> None:
@@ -72,6 +70,10 @@ def initialize_chat_state() -> None:
     if "messages" not in st.session_state:
         st.session_state.messages = [create_welcome_message()]
 
+    # Keys this session's agent (and conversation memory) in the agent pool
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+
 
 def create_welcome_message() -> Dict[str, str]:
     """Create initial welcome message"""
@@ -90,15 +92,18 @@ def handle_user_input(config: Dict[str, Any]) -> None:
         # Add user message to history
         add_user_message(prompt)
 
-        # Process through agents and get response
-        with st.spinner("Thinking..."):
-            response = route_message_to_agents(prompt, config)
+        with st.chat_message("user"):
+            st.markdown(prompt)
 
-        # Add agent response to history
-        add_agent_response_to_history(response)
+        # Process through agents, rendering the reply as it is generated
+        responses: List[AgentResponse] = []
+        with st.chat_message("assistant"):
+            st.write_stream(stream_message_to_agents(prompt, config, responses))
 
-        # Refresh the page to show new messages
-        st.rerun()
+            # Add agent response to history and render its attachments in
+            # place; the new turn is already on screen, so no rerun is needed
+            add_agent_response_to_history(responses[-1])
+            display_message_attachments(st.session_state.messages[-1])
 
 
 def add_user_message(prompt: str) -> None:
@@ -109,20 +114,38 @@ def add_user_message(prompt: str) -> None:
 # Deprecated functions - removed as they're no longer needed with native chat interface
 
 
-def route_message_to_agents(prompt: str, config: Dict[str, Any]) -> AgentResponse:
-    """
-    Main routing logic - sends message through agent pipeline
-    """
-    # Get chat agent from factory
-    chat_agent = get_chat_agent(config)
+@st.cache_resource(show_spinner=False)
+def _cached_agent_pool(config: Dict[str, Any]):
+    """Agent pool shared across reruns and sessions, built once per config"""
+    return get_agent_pool(config)
 
-    # Process message through the graph-based chat agent
-    # The GraphChatAgent now handles intent parsing, routing, and response generation internally
-    response = chat_agent.process_message(
-        message=prompt,
-    )
 
-    return response
+def stream_message_to_agents(
+    prompt: str, config: Dict[str, Any], responses: List[AgentResponse]
+) -> Iterator[str]:
+    """
+    Main routing logic - sends message through the agent pipeline, yielding the
+    reply text as it is generated and appending the complete response to
+    `responses`
+    """
+    pool = _cached_agent_pool(config)
+
+    # Each session gets its own agent, held for the whole turn
+    try:
+        with pool.acquire(st.session_state.session_id) as chat_agent:
+            # st.write_stream consumes a sync iterator, so drive the async
+            # stream on the persistent agent loop (shared HTTP clients
+            # survive across turns)
+            for item in iterate(chat_agent.stream_message(message=prompt)):
+                if isinstance(item, str):
+                    yield item
+                else:
+                    responses.append(item)
+    except TimeoutError as e:
+        # Every pooled agent is serving another session
+        response = handle_error(e)
+        responses.append(response)
+        yield response.text
 
 
 def validate_data_availability() -> bool:
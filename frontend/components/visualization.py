@@ -3,11 +3,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
-from backend.visualization.charts import TimeSeriesCharts
-from backend.analysis.anomaly_detection import AnomalyDetector
+from typing import TYPE_CHECKING, Dict, Any
 import logging
 
+if TYPE_CHECKING:
+    # Charting and analysis modules are imported only once the panel has data
+    from backend.visualization.charts import TimeSeriesCharts
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,8 +34,8 @@ def create_visualization_panel(config: Dict[str, Any]) -> None:
     columns = st.session_state.selected_columns
     viz_type = st.session_state.visualization_type
 
-    # Create charts object
-    charts = TimeSeriesCharts()
+    # Charts object, shared across reruns
+    charts = _charts()
 
     # Show different visualizations based on selected type
     if viz_type == "line_chart":
@@ -43,8 +45,16 @@ def create_visualization_panel(config: Dict[str, Any]) -> None:
         display_anomaly_detection(df, columns, charts)
 
 
+@st.cache_resource(show_spinner=False)
+def _charts() -> "TimeSeriesCharts":
+    """Create the charts object on first use"""
+    from backend.visualization.charts import TimeSeriesCharts
+
+    return TimeSeriesCharts()
+
+
 def display_line_chart(
-    df: pd.DataFrame, columns: str, charts: TimeSeriesCharts
+    df: pd.DataFrame, columns: str, charts: "TimeSeriesCharts"
 ) -> None:
     """
     Display a line chart visualization
@@ -66,7 +76,7 @@ def display_line_chart(
 
 
 def display_anomaly_detection(
-    df: pd.DataFrame, column: str, charts: TimeSeriesCharts
+    df: pd.DataFrame, column: str, charts: "TimeSeriesCharts"
 ) -> None:
     """
     Display anomaly detection visualization
@@ -81,6 +91,8 @@ def display_anomaly_detection(
     z_score_threshold = st.session_state.get("z_score_threshold", 3.0)
 
     # Create anomaly detector
+    from backend.analysis.anomaly_detection import AnomalyDetector
+
     detector = AnomalyDetector({"z_score_threshold": z_score_threshold})
 
     # Detect anomalies